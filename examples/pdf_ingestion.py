@@ -7,61 +7,143 @@ Extracts text from PDF documents, chunks it intelligently, and ingests into Pine
 import os
 import sys
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import orjson
 import hashlib
+import gzip
+import re
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import argparse
+import bisect
+import importlib
+import multiprocessing
 
-try:
-    import PyPDF2
-except ImportError:
-    print("❌ PyPDF2 not installed. Installing...")
-    os.system("pip install PyPDF2")
-    import PyPDF2
 
-try:
-    from sentence_transformers import SentenceTransformer
-    import tiktoken
-except ImportError:
-    print("❌ Required packages not found. Installing...")
-    os.system("pip install sentence-transformers tiktoken")
-    from sentence_transformers import SentenceTransformer
-    import tiktoken
+def _require(module: str):
+    """Import a module on first use, exiting with an install hint if missing.
+    
+    Heavy dependencies are loaded lazily so --help and argument errors
+    return without importing them.
+    """
+    try:
+        return importlib.import_module(module)
+    except ImportError:
+        print(f"❌ {module} not installed. Install with: pip install -r requirements.txt")
+        sys.exit(1)
+
+
+# Paragraphs are separated by blank lines; sentences end in terminal
+# punctuation followed by a capitalized or numeric start, so "U.S." and
+# "3.14" stay intact
+_PARAGRAPH_RE = re.compile(r"\n{2,}")
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9])")
+
+# all-MiniLM-L6-v2, the API's default embedder, truncates input past 256 tokens,
+# so larger chunks are only partly embedded
+EMBEDDING_MAX_TOKENS = 256
+
+# Paragraphs are token-counted in tiles of roughly this many characters so the
+# batch encoder never holds token lists for the whole document at once
+TOKEN_TILE_CHARS = 128 * 1024
+
+# PDFs shorter than this are extracted inline; pool startup would dominate
+PARALLEL_MIN_PAGES = 8
+
+
+def _extract_page_range(pdf_path: str, start: int, end: int) -> List[Tuple[int, str, Optional[str]]]:
+    """Extract (page_num, text, error) for pages [start, end).
+
+    Runs in worker processes, so each call opens its own document handle.
+    """
+    pdfium = _require("pypdfium2")
+    pages = []
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        for index in range(start, end):
+            try:
+                page = pdf[index]
+                textpage = page.get_textpage()
+                # PDFium emits CRLF line breaks; normalize so paragraph splitting still works
+                page_text = textpage.get_text_range().replace("\r\n", "\n")
+                textpage.close()
+                page.close()
+                pages.append((index + 1, page_text, None))
+            except Exception as e:
+                pages.append((index + 1, "", str(e)))
+    finally:
+        pdf.close()
+    return pages
+
 
 class PDFProcessor:
     def __init__(self, api_base_url: str = "http://localhost:8000"):
         self.api_base_url = api_base_url
+        # Keep-alive session so every API call reuses pooled connections
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         # Initialize tokenizer for chunking
         try:
+            import tiktoken
             self.encoding = tiktoken.get_encoding("cl100k_base")
+        except ImportError:
+            print("⚠️  tiktoken not installed, approximating token counts. Install with: pip install tiktoken")
+            self.encoding = None
         except:
             self.encoding = None
     
-    def extract_text_from_pdf(self, pdf_path: str) -> str:
-        """Extract text from PDF file."""
-        text = ""
+    def extract_text_from_pdf(self, pdf_path: str, max_workers: Optional[int] = None) -> str:
+        """Extract text from PDF file, spreading pages across worker processes.
+        
+        PDFium is not thread-safe, so parallelism is process-based; pass
+        max_workers=1 to extract inline when memory is tight.
+        """
         try:
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                
-                print(f"📄 Processing {len(pdf_reader.pages)} pages...")
-                
-                for page_num, page in enumerate(pdf_reader.pages, 1):
-                    try:
-                        page_text = page.extract_text()
-                        if page_text.strip():
-                            text += f"\n--- Page {page_num} ---\n{page_text}\n"
-                        print(f"   ✅ Extracted page {page_num}")
-                    except Exception as e:
-                        print(f"   ⚠️  Error on page {page_num}: {e}")
-                        continue
-                        
+            pdfium = _require("pypdfium2")
+            pdf = pdfium.PdfDocument(pdf_path)
+            page_count = len(pdf)
+            pdf.close()
+            
+            print(f"📄 Processing {page_count} pages...")
+            
+            workers = min(max_workers or os.cpu_count() or 1, page_count)
+            if page_count < PARALLEL_MIN_PAGES or workers < 2:
+                pages = _extract_page_range(pdf_path, 0, page_count)
+            else:
+                # Contiguous page ranges keep results in document order. Workers are
+                # spawned, not forked: main() runs index setup on a thread meanwhile,
+                # and forking while it holds HTTP/SSL/logging locks can deadlock them
+                step = -(-page_count // workers)
+                with ProcessPoolExecutor(
+                    max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+                ) as executor:
+                    futures = [
+                        executor.submit(_extract_page_range, pdf_path, start, min(start + step, page_count))
+                        for start in range(0, page_count, step)
+                    ]
+                    pages = [page for future in futures for page in future.result()]
         except Exception as e:
             print(f"❌ Error reading PDF: {e}")
             return ""
         
-        return text.strip()
+        parts = []
+        for page_num, page_text, error in pages:
+            if error:
+                print(f"   ⚠️  Error on page {page_num}: {error}")
+                continue
+            if page_text.strip():
+                parts.append(f"\n--- Page {page_num} ---\n{page_text}\n")
+        
+        return "".join(parts).strip()
     
     def count_tokens(self, text: str) -> int:
         """Count tokens in text."""
@@ -71,95 +153,175 @@ class PDFProcessor:
             # Rough approximation: 1 token ≈ 4 characters
             return len(text) // 4
     
-    def chunk_text(self, text: str, chunk_size: int = 1000, overlap: int = 200) -> List[Dict[str, Any]]:
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """Count tokens for many texts in one tokenizer call."""
+        if self.encoding:
+            return [len(tokens) for tokens in self.encoding.encode_batch(texts)]
+        else:
+            return [len(text) // 4 for text in texts]
+    
+    def iter_token_counts(self, texts: List[str]):
+        """Yield token counts, batch-encoding tiles of about TOKEN_TILE_CHARS characters."""
+        tile = []
+        tile_chars = 0
+        for text in texts:
+            tile.append(text)
+            tile_chars += len(text)
+            if tile_chars >= TOKEN_TILE_CHARS:
+                yield from self.count_tokens_batch(tile)
+                tile = []
+                tile_chars = 0
+        if tile:
+            yield from self.count_tokens_batch(tile)
+    
+    def chunk_text(self, text: str, chunk_size: int = EMBEDDING_MAX_TOKENS, overlap: int = 32, legacy: bool = False) -> List[Dict[str, Any]]:
         """Split text into overlapping chunks."""
         if not text.strip():
             return []
         
+        if self.encoding and not legacy:
+            return self._chunk_token_ids(text, chunk_size, overlap)
+        
         # Split by paragraphs first, then by sentences if needed
-        paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
+        paragraphs = [p.strip() for p in _PARAGRAPH_RE.split(text) if p.strip()]
         
         chunks = []
-        current_chunk = ""
+        # Pieces of the chunk being built; joined once when the chunk is emitted
+        current_parts: List[str] = []
         current_size = 0
-        chunk_id = 0
         
-        for paragraph in paragraphs:
-            paragraph_size = self.count_tokens(paragraph)
-            
+        for paragraph, paragraph_size in zip(paragraphs, self.iter_token_counts(paragraphs)):
             # If paragraph is too long, split it further
             if paragraph_size > chunk_size:
                 # If we have content in current chunk, save it
-                if current_chunk.strip():
-                    chunks.append({
-                        "chunk_id": chunk_id,
-                        "text": current_chunk.strip(),
-                        "token_count": current_size
-                    })
-                    chunk_id += 1
-                    current_chunk = ""
+                if current_parts:
+                    self._append_chunk(chunks, current_parts, current_size)
+                    current_parts = []
                     current_size = 0
                 
                 # Split long paragraph by sentences
-                sentences = [s.strip() + '.' for s in paragraph.split('.') if s.strip()]
+                sentences = [s.strip() for s in _SENTENCE_RE.split(paragraph) if s.strip()]
                 
-                for sentence in sentences:
-                    sentence_size = self.count_tokens(sentence)
-                    
-                    if current_size + sentence_size > chunk_size and current_chunk.strip():
-                        # Save current chunk
-                        chunks.append({
-                            "chunk_id": chunk_id,
-                            "text": current_chunk.strip(),
-                            "token_count": current_size
-                        })
-                        chunk_id += 1
-                        
-                        # Start new chunk with overlap
-                        if overlap > 0 and chunks:
-                            # Take last few sentences for overlap
-                            overlap_text = ' '.join(current_chunk.split()[-overlap//4:])
-                            current_chunk = overlap_text + ' ' + sentence
-                            current_size = self.count_tokens(current_chunk)
-                        else:
-                            current_chunk = sentence
-                            current_size = sentence_size
+                for sentence, sentence_size in zip(sentences, self.count_tokens_batch(sentences)):
+                    if current_size + sentence_size > chunk_size and current_parts:
+                        current_parts, current_size = self._emit_and_overlap(
+                            chunks, current_parts, current_size, overlap, ' ', sentence, sentence_size
+                        )
                     else:
-                        current_chunk += ' ' + sentence
+                        current_parts += (' ', sentence)
                         current_size += sentence_size
             
             # Normal paragraph processing
-            elif current_size + paragraph_size > chunk_size and current_chunk.strip():
-                # Save current chunk
-                chunks.append({
-                    "chunk_id": chunk_id,
-                    "text": current_chunk.strip(),
-                    "token_count": current_size
-                })
-                chunk_id += 1
-                
-                # Start new chunk with overlap
-                if overlap > 0 and chunks:
-                    overlap_text = ' '.join(current_chunk.split()[-overlap//4:])
-                    current_chunk = overlap_text + '\n\n' + paragraph
-                    current_size = self.count_tokens(current_chunk)
-                else:
-                    current_chunk = paragraph
-                    current_size = paragraph_size
+            elif current_size + paragraph_size > chunk_size and current_parts:
+                current_parts, current_size = self._emit_and_overlap(
+                    chunks, current_parts, current_size, overlap, '\n\n', paragraph, paragraph_size
+                )
             else:
-                if current_chunk:
-                    current_chunk += '\n\n' + paragraph
+                if current_parts:
+                    current_parts += ('\n\n', paragraph)
                 else:
-                    current_chunk = paragraph
+                    current_parts = [paragraph]
                 current_size += paragraph_size
         
         # Add the last chunk
-        if current_chunk.strip():
-            chunks.append({
-                "chunk_id": chunk_id,
-                "text": current_chunk.strip(),
-                "token_count": current_size
-            })
+        if current_parts:
+            self._append_chunk(chunks, current_parts, current_size)
+        
+        return chunks
+    
+    def _append_chunk(self, chunks: List[Dict[str, Any]], parts: List[str], size: int) -> str:
+        """Join the pending parts into the next chunk and return its text."""
+        chunk_text = "".join(parts).strip()
+        chunks.append({
+            "chunk_id": len(chunks),
+            "text": chunk_text,
+            "token_count": size
+        })
+        return chunk_text
+    
+    def _emit_and_overlap(
+        self,
+        chunks: List[Dict[str, Any]],
+        parts: List[str],
+        size: int,
+        overlap: int,
+        separator: str,
+        piece: str,
+        piece_size: int
+    ) -> Tuple[List[str], int]:
+        """Emit the pending chunk and start the next one with its trailing words plus piece."""
+        chunk_text = self._append_chunk(chunks, parts, size)
+        
+        # Roughly 4 tokens per word, rounded up so any positive overlap carries at
+        # least one word; rsplit only scans the tail of the chunk
+        overlap_words = -(-overlap // 4)
+        if overlap_words <= 0:
+            return [piece], piece_size
+        
+        tail = chunk_text.rsplit(None, overlap_words)
+        overlap_text = ' '.join(tail[1:] if len(tail) > overlap_words else tail)
+        return [overlap_text, separator, piece], self.count_tokens(overlap_text) + piece_size
+    
+    def _chunk_token_ids(self, text: str, chunk_size: int, overlap: int) -> List[Dict[str, Any]]:
+        """Chunk by sliding a window over token ids, encoding once and decoding per chunk.
+        
+        Chunk ends snap back to the last paragraph break in the second half of the
+        window so chunks still tend to hold whole paragraphs. Window bounds never
+        fall inside a UTF-8 character that spans several tokens, so non-ASCII text
+        decodes without replacement characters at chunk edges.
+        """
+        ids = self.encoding.encode(text)
+        total = len(ids)
+        
+        # Tokens that contain a blank line, and tokens that begin with a UTF-8
+        # continuation byte (they finish a character started by the previous
+        # token, so no window may start or end just before one)
+        break_ids = set()
+        continuation_ids = set()
+        for token in set(ids):
+            token_bytes = self.encoding.decode_single_token_bytes(token)
+            if b"\n\n" in token_bytes:
+                break_ids.add(token)
+            if token_bytes and token_bytes[0] & 0xC0 == 0x80:
+                continuation_ids.add(token)
+        
+        # Positions just after a token that contains a blank line
+        breaks = [i + 1 for i, token in enumerate(ids) if token in break_ids]
+        
+        def snap_to_char(pos: int, floor: int) -> int:
+            """Move pos back to a character boundary above floor, else forward to one."""
+            back = pos
+            while back > floor and back < total and ids[back] in continuation_ids:
+                back -= 1
+            if back > floor and (back >= total or ids[back] not in continuation_ids):
+                return back
+            while pos < total and ids[pos] in continuation_ids:
+                pos += 1
+            return pos
+        
+        chunks = []
+        chunk_id = 0
+        start = 0
+        while start < total:
+            end = min(start + chunk_size, total)
+            if end < total:
+                snap = bisect.bisect_right(breaks, end) - 1
+                if snap >= 0 and breaks[snap] > start + chunk_size // 2:
+                    end = breaks[snap]
+                end = snap_to_char(end, start)
+            
+            chunk_text = self.encoding.decode(ids[start:end]).strip()
+            if chunk_text:
+                chunks.append({
+                    "chunk_id": chunk_id,
+                    "text": chunk_text,
+                    "token_count": end - start
+                })
+                chunk_id += 1
+            
+            if end >= total:
+                break
+            start = snap_to_char(max(end - overlap, start + 1), start)
         
         return chunks
     
@@ -168,37 +330,37 @@ class PDFProcessor:
         if metadata is None:
             metadata = {}
         
-        documents = []
-        file_hash = hashlib.md5(pdf_filename.encode()).hexdigest()[:8]
+        # Not a security use; MD5 is kept so IDs stay stable across re-ingests
+        file_hash = hashlib.md5(pdf_filename.encode(), usedforsecurity=False).hexdigest()[:8]
         
-        for chunk in chunks:
-            doc_id = f"{file_hash}_chunk_{chunk['chunk_id']}"
-            
-            doc_metadata = {
-                "source_file": pdf_filename,
-                "chunk_id": chunk['chunk_id'],
-                "token_count": chunk['token_count'],
-                "document_type": "pdf",
-                **metadata
-            }
-            
-            document = {
-                "id": doc_id,
+        # Shared fields are merged once; user metadata still overrides every default
+        base_meta = {"source_file": pdf_filename, "document_type": "pdf", **metadata}
+        
+        return [
+            {
+                "id": f"{file_hash}_chunk_{chunk['chunk_id']}",
                 "text": chunk['text'],
-                "metadata": doc_metadata
+                "metadata": {"chunk_id": chunk['chunk_id'], "token_count": chunk['token_count'], **base_meta}
             }
-            
-            documents.append(document)
-        
-        return documents
+            for chunk in chunks
+        ]
+    
+    def _post_json(self, url: str, payload: Any, compress: bool = False) -> requests.Response:
+        """POST a JSON payload serialized with orjson, optionally gzip-compressed."""
+        body = orjson.dumps(payload)
+        headers = {"Content-Type": "application/json"}
+        if compress:
+            body = gzip.compress(body, compresslevel=5)
+            headers["Content-Encoding"] = "gzip"
+        return self.session.post(url, data=body, headers=headers)
     
     def create_index_if_not_exists(self, index_name: str) -> bool:
         """Create index if it doesn't exist."""
         try:
             # Check if index exists
-            response = requests.get(f"{self.api_base_url}/indexes")
+            response = self.session.get(f"{self.api_base_url}/indexes")
             if response.status_code == 200:
-                indexes = response.json().get('indexes', [])
+                indexes = orjson.loads(response.content).get('indexes', [])
                 if index_name in indexes:
                     print(f"✅ Index '{index_name}' already exists")
                     return True
@@ -210,9 +372,9 @@ class PDFProcessor:
                 "metric": "cosine"
             }
             
-            response = requests.post(
+            response = self._post_json(
                 f"{self.api_base_url}/indexes",
-                json=create_data
+                create_data
             )
             
             if response.status_code == 200:
@@ -227,45 +389,79 @@ class PDFProcessor:
             print(f"❌ Error checking/creating index: {e}")
             return False
     
-    def ingest_documents(self, index_name: str, documents: List[Dict], namespace: str = "default") -> bool:
-        """Ingest documents into the vector store."""
+    def ingest_documents(
+        self,
+        index_name: str,
+        documents: List[Dict],
+        namespace: str = "default",
+        batch_size: int = 64,
+        concurrency: int = 4,
+        compress: bool = False
+    ) -> bool:
+        """Ingest documents into the vector store, uploading batches concurrently."""
         try:
             print(f"📤 Uploading {len(documents)} documents to '{index_name}/{namespace}'...")
             
+            # The server embeds each batch in one call; grouping similar lengths
+            # keeps padding per batch low
+            documents = sorted(documents, key=lambda doc: len(doc["text"]))
+            batches = [documents[i:i + batch_size] for i in range(0, len(documents), batch_size)]
+            
+            with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+                results = list(executor.map(
+                    lambda batch: self._upload_batch(index_name, batch, namespace, batch_size, compress),
+                    batches
+                ))
+            
+            failed = results.count(False)
+            if failed:
+                print(f"❌ {failed} of {len(batches)} batches failed to upload")
+                return False
+            
+            print(f"✅ Successfully uploaded {len(batches)} batches")
+            return True
+                    
+        except Exception as e:
+            print(f"❌ Error ingesting documents: {e}")
+            return False
+    
+    def _upload_batch(self, index_name: str, documents: List[Dict], namespace: str, batch_size: int, compress: bool = False) -> bool:
+        """Upload one batch, falling back to the regular endpoint if the batch endpoint fails."""
+        try:
             # Use batch endpoint for better performance
             batch_data = {
                 "index_name": index_name,
                 "documents": documents,
-                "batch_size": 50,
+                "batch_size": batch_size,
                 "namespace": namespace
             }
             
-            response = requests.post(
+            response = self._post_json(
                 f"{self.api_base_url}/indexes/{index_name}/documents/batch",
-                json=batch_data
+                batch_data,
+                compress
             )
             
             if response.status_code == 200:
-                print("✅ Successfully started batch ingestion")
                 return True
-            else:
-                # Try regular endpoint
-                print("⚠️  Batch endpoint failed, trying regular upload...")
-                response = requests.post(
-                    f"{self.api_base_url}/indexes/{index_name}/documents?namespace={namespace}",
-                    json=documents
-                )
-                
-                if response.status_code == 200:
-                    print("✅ Successfully uploaded documents")
-                    return True
-                else:
-                    print(f"❌ Error uploading documents: {response.status_code}")
-                    print(response.text)
-                    return False
-                    
+            
+            # Try regular endpoint
+            print("⚠️  Batch endpoint failed, trying regular upload...")
+            response = self._post_json(
+                f"{self.api_base_url}/indexes/{index_name}/documents?namespace={namespace}",
+                documents,
+                compress
+            )
+            
+            if response.status_code == 200:
+                return True
+            
+            print(f"❌ Error uploading documents: {response.status_code}")
+            print(response.text)
+            return False
+        
         except Exception as e:
-            print(f"❌ Error ingesting documents: {e}")
+            print(f"❌ Error uploading batch: {e}")
             return False
     
     def test_search(self, index_name: str, namespace: str = "default") -> bool:
@@ -279,13 +475,13 @@ class PDFProcessor:
                 "namespace": namespace
             }
             
-            response = requests.post(
+            response = self._post_json(
                 f"{self.api_base_url}/indexes/{index_name}/search/semantic",
-                json=search_data
+                search_data
             )
             
             if response.status_code == 200:
-                results = response.json().get('results', [])
+                results = orjson.loads(response.content).get('results', [])
                 print(f"✅ Search successful! Found {len(results)} results")
                 
                 for i, result in enumerate(results[:2], 1):
@@ -306,9 +502,14 @@ def main():
     parser.add_argument("pdf_path", help="Path to PDF file")
     parser.add_argument("--index", default="documents", help="Index name (default: documents)")
     parser.add_argument("--namespace", default="default", help="Namespace (default: default)")
-    parser.add_argument("--chunk-size", type=int, default=1000, help="Chunk size in tokens (default: 1000)")
-    parser.add_argument("--overlap", type=int, default=200, help="Chunk overlap in tokens (default: 200)")
+    parser.add_argument("--chunk-size", type=int, default=EMBEDDING_MAX_TOKENS, help=f"Chunk size in tokens (default: {EMBEDDING_MAX_TOKENS}, the embedder's input limit)")
+    parser.add_argument("--overlap", type=int, default=32, help="Chunk overlap in tokens (default: 32)")
+    parser.add_argument("--batch-size", type=int, default=64, help="Documents embedded per server-side batch (default: 64)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Parallel upload requests (default: 4)")
+    parser.add_argument("--workers", type=int, help="Max PDF extraction processes; 1 extracts inline (default: CPU count)")
+    parser.add_argument("--compress", action="store_true", help="Gzip upload request bodies (server must accept Content-Encoding: gzip)")
     parser.add_argument("--metadata", help="Additional metadata as JSON string")
+    parser.add_argument("--legacy-chunking", action="store_true", help="Use the paragraph/sentence string chunker instead of token-id windows")
     
     args = parser.parse_args()
     
@@ -333,12 +534,19 @@ def main():
     print(f"📂 Namespace: {args.namespace}")
     print(f"✂️  Chunk size: {args.chunk_size} tokens")
     print(f"🔄 Overlap: {args.overlap} tokens")
+    if args.chunk_size > EMBEDDING_MAX_TOKENS:
+        print(f"⚠️  Chunks over {EMBEDDING_MAX_TOKENS} tokens are truncated by the default embedding model")
     
     processor = PDFProcessor()
     
+    # Index setup only waits on the API, so run it while the PDF is extracted and chunked
+    setup_executor = ThreadPoolExecutor(max_workers=1)
+    index_ready = setup_executor.submit(processor.create_index_if_not_exists, args.index)
+    setup_executor.shutdown(wait=False)
+    
     # Step 1: Extract text
     print(f"\n1️⃣ Extracting text from PDF...")
-    text = processor.extract_text_from_pdf(args.pdf_path)
+    text = processor.extract_text_from_pdf(args.pdf_path, args.workers)
     
     if not text:
         print("❌ No text extracted from PDF")
@@ -348,7 +556,7 @@ def main():
     
     # Step 2: Chunk text
     print(f"\n2️⃣ Chunking text...")
-    chunks = processor.chunk_text(text, args.chunk_size, args.overlap)
+    chunks = processor.chunk_text(text, args.chunk_size, args.overlap, legacy=args.legacy_chunking)
     print(f"✅ Created {len(chunks)} chunks")
     
     # Step 3: Prepare documents
@@ -357,15 +565,15 @@ def main():
     documents = processor.prepare_documents(chunks, pdf_filename, metadata)
     print(f"✅ Prepared {len(documents)} documents")
     
-    # Step 4: Create index
+    # Step 4: Wait for the background index setup
     print(f"\n4️⃣ Setting up index...")
-    if not processor.create_index_if_not_exists(args.index):
+    if not index_ready.result():
         print("❌ Failed to create/verify index")
         sys.exit(1)
     
     # Step 5: Ingest documents
     print(f"\n5️⃣ Ingesting documents...")
-    if not processor.ingest_documents(args.index, documents, args.namespace):
+    if not processor.ingest_documents(args.index, documents, args.namespace, args.batch_size, args.concurrency, args.compress):
         print("❌ Failed to ingest documents")
         sys.exit(1)
     
@@ -5,6 +5,8 @@ Setup script to add sample IAM content to demo-index for testing the agent
 
 import requests
 import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 API_BASE = "http://localhost:8000"
 
@@ -79,12 +81,28 @@ This policy follows the principle of least privilege by only allowing read opera
     }
 ]
 
+def create_session() -> requests.Session:
+    """Create a pooled keep-alive session shared by every API call."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
 def main():
+    with create_session() as session:
+        run_setup(session)
+
+def run_setup(session: requests.Session):
     print("🚀 Setting up IAM demo content in demo-index...")
     
     # Check API status
     try:
-        response = requests.get(f"{API_BASE}/health")
+        response = session.get(f"{API_BASE}/health")
         if response.status_code != 200:
             print("❌ API not available. Please start the server first with: uvicorn src.api:app --reload")
             return
@@ -95,7 +113,7 @@ def main():
     
     # Ensure we're using Pinecone MCP for advanced features
     try:
-        response = requests.post(f"{API_BASE}/config/switch-store?store_type=pinecone_mcp")
+        response = session.post(f"{API_BASE}/config/switch-store?store_type=pinecone_mcp")
         if response.status_code == 200:
             print("✅ Using Pinecone MCP backend")
         else:
@@ -108,7 +126,7 @@ def main():
     
     try:
         # Send documents as a direct list with namespace as query parameter
-        response = requests.post(
+        response = session.post(
             f"{API_BASE}/indexes/demo-index/documents?namespace=iam-demo", 
             json=SAMPLE_DOCS
         )
@@ -139,7 +157,7 @@ def main():
                 "top_k": 2,
                 "namespace": "iam-demo"
             }
-            response = requests.post(f"{API_BASE}/indexes/demo-index/search/semantic", json=search_data)
+            response = session.post(f"{API_BASE}/indexes/demo-index/search/semantic", json=search_data)
             if response.status_code == 200:
                 results = response.json().get("results", [])
                 print(f"✅ Query '{query}': Found {len(results)} results")
@@ -1,9 +1,14 @@
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Header, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import JSONResponse, ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from typing import List, Dict, Any, Optional
 import asyncio
+import zlib
+import orjson
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 import os
 from dotenv import load_dotenv
 
@@ -14,6 +19,48 @@ from .vector_store.base import SearchResult
 # Load environment variables
 load_dotenv()
 
+
+@dataclass(frozen=True)
+class Settings:
+    """Environment configuration, read once instead of per request."""
+    pinecone_api_key: Optional[str]
+    pinecone_environment: str
+    qdrant_host: str
+    qdrant_port: int
+    qdrant_api_key: Optional[str]
+    # Semantic searches arriving within this window are sent to the store together;
+    # a search with nothing queued behind it is not delayed. 0 disables batching
+    search_batch_window_ms: float
+    # Background batch ingests allowed to run at once; the rest wait their turn
+    max_concurrent_ingests: int
+    # Largest gzip request body accepted, measured after decompression
+    max_request_body_bytes: int
+    api_host: str
+    api_port: int
+    # Each worker holds its own agent and current store; only raise this when the
+    # store is never switched at runtime
+    api_workers: int
+    
+    @classmethod
+    def from_env(cls) -> "Settings":
+        return cls(
+            pinecone_api_key=os.getenv("PINECONE_API_KEY"),
+            pinecone_environment=os.getenv("PINECONE_ENVIRONMENT", "us-east-1"),
+            qdrant_host=os.getenv("QDRANT_HOST", "localhost"),
+            qdrant_port=int(os.getenv("QDRANT_PORT", "6333")),
+            qdrant_api_key=os.getenv("QDRANT_API_KEY"),
+            search_batch_window_ms=float(os.getenv("SEARCH_BATCH_WINDOW_MS", "5")),
+            max_concurrent_ingests=int(os.getenv("MAX_CONCURRENT_INGESTS", "4")),
+            max_request_body_bytes=int(os.getenv("MAX_REQUEST_BODY_BYTES", str(64 * 1024 * 1024))),
+            api_host=os.getenv("API_HOST", "0.0.0.0"),
+            api_port=int(os.getenv("API_PORT", "8000")),
+            api_workers=int(os.getenv("API_WORKERS", "1")),
+        )
+
+
+# Read once at import; the middleware, the lifespan and __main__ all use this instance
+settings = Settings.from_env()
+
 # Pydantic models for request/response
 class DocumentInput(BaseModel):
     id: Optional[str] = None
@@ -66,31 +113,314 @@ class SimilaritySearchRequest(SearchRequest):
     similarity_threshold: float = 0.7
 
 
+class RequestBodyTooLarge(Exception):
+    """Raised when a request body grows past the configured limit."""
+
+
+def _gunzip_limited(data: bytes, max_size: int) -> bytes:
+    """Decompress gzip data (one or more members) without producing more than max_size bytes.
+    
+    Output is pulled from zlib at most max_size + 1 bytes at a time, so a
+    small gzip bomb is rejected before it can expand in memory.
+    """
+    parts = []
+    size = 0
+    while data:
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        while True:
+            piece = decompressor.decompress(data, max_size - size + 1)
+            size += len(piece)
+            if size > max_size:
+                raise RequestBodyTooLarge()
+            parts.append(piece)
+            data = decompressor.unconsumed_tail
+            if decompressor.eof:
+                # Anything after the end of a member is the next member
+                data = decompressor.unused_data
+                break
+            if not data:
+                raise EOFError("Compressed request body ended before the end-of-stream marker")
+    return b"".join(parts)
+
+
+class GzipRequestMiddleware:
+    """Decompress request bodies sent with Content-Encoding: gzip."""
+    
+    def __init__(self, app, max_body_bytes: int):
+        self.app = app
+        self.max_body_bytes = max_body_bytes
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or (b"content-encoding", b"gzip") not in scope["headers"]:
+            await self.app(scope, receive, send)
+            return
+        
+        chunks = []
+        received = 0
+        while True:
+            message = await receive()
+            chunk = message.get("body", b"")
+            received += len(chunk)
+            if received > self.max_body_bytes:
+                await self._too_large(scope, receive, send)
+                return
+            chunks.append(chunk)
+            if not message.get("more_body", False):
+                break
+        
+        try:
+            body = _gunzip_limited(b"".join(chunks), self.max_body_bytes)
+        except RequestBodyTooLarge:
+            await self._too_large(scope, receive, send)
+            return
+        except (zlib.error, EOFError):
+            response = JSONResponse({"detail": "Invalid gzip request body"}, status_code=400)
+            await response(scope, receive, send)
+            return
+        
+        headers = [
+            (name, value) for name, value in scope["headers"]
+            if name not in (b"content-encoding", b"content-length")
+        ]
+        headers.append((b"content-length", str(len(body)).encode()))
+        scope = dict(scope, headers=headers)
+        
+        body_sent = False
+        
+        async def receive_body():
+            nonlocal body_sent
+            if body_sent:
+                return await receive()
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        
+        await self.app(scope, receive_body, send)
+    
+    async def _too_large(self, scope, receive, send):
+        response = JSONResponse(
+            {"detail": f"Request body exceeds {self.max_body_bytes} bytes"},
+            status_code=413
+        )
+        await response(scope, receive, send)
+
+
+# Result lists at least this long are encoded in a worker thread (~1 ms per 1000 hits)
+THREADED_SERIALIZATION_MIN_RESULTS = 500
+
+# Streamed (Accept: application/x-ndjson) responses send this many results per chunk
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+NDJSON_CHUNK_RESULTS = 64
+
+
+def _encode_results(results: List[SearchResult]) -> bytes:
+    return orjson.dumps({"results": [
+        {"id": r.id, "score": r.score, "text": r.text, "metadata": r.metadata}
+        for r in results
+    ]})
+
+
+async def _results_response(results: List[SearchResult], accept: Optional[str] = None) -> Response:
+    """Serialize search results straight to orjson, skipping jsonable_encoder.
+
+    Results come from our own vector store adapters, so they are emitted as
+    plain dicts instead of going back through Pydantic. Large result lists are
+    encoded off the event loop so other requests keep being served. Clients
+    sending Accept: application/x-ndjson get one result per line, streamed.
+    """
+    if accept and NDJSON_MEDIA_TYPE in accept:
+        return StreamingResponse(_ndjson_results(results), media_type=NDJSON_MEDIA_TYPE)
+    if len(results) >= THREADED_SERIALIZATION_MIN_RESULTS:
+        content = await asyncio.to_thread(_encode_results, results)
+    else:
+        content = _encode_results(results)
+    return Response(content=content, media_type="application/json")
+
+
+async def _ndjson_results(results: List[SearchResult]):
+    """Yield results as newline-delimited JSON, a few dozen lines per chunk."""
+    for start in range(0, len(results), NDJSON_CHUNK_RESULTS):
+        yield b"".join(
+            orjson.dumps({"id": r.id, "score": r.score, "text": r.text, "metadata": r.metadata}) + b"\n"
+            for r in results[start:start + NDJSON_CHUNK_RESULTS]
+        )
+
+
+_DOCUMENT_LIST = TypeAdapter(List[DocumentInput])
+_ID_LIST = TypeAdapter(List[str])
+
+
+def _fast_document_dict(doc: Any) -> Optional[Dict[str, Any]]:
+    """Build an ingest dict from already-decoded JSON, or None if it needs full validation."""
+    if type(doc) is not dict:
+        return None
+    text = doc.get("text")
+    doc_id = doc.get("id")
+    metadata = doc.get("metadata", {})
+    embedding = doc.get("embedding")
+    if type(text) is not str or (doc_id is not None and type(doc_id) is not str) or type(metadata) is not dict:
+        return None
+    if embedding is not None and (type(embedding) is not list or not all(type(x) is float for x in embedding)):
+        return None
+    return {"id": doc_id, "text": text, "metadata": metadata, "embedding": embedding}
+
+
+def _document_dicts(raw: Any, loc: tuple = ("body",)) -> List[Dict[str, Any]]:
+    """Turn a decoded JSON document list into ingest dicts.
+
+    Well-formed payloads skip Pydantic entirely; anything else goes through
+    DocumentInput validation so clients still get the usual 422 details.
+    """
+    if type(raw) is list:
+        doc_dicts = [_fast_document_dict(doc) for doc in raw]
+        if None not in doc_dicts:
+            return doc_dicts
+    try:
+        return [doc.model_dump() for doc in _DOCUMENT_LIST.validate_python(raw)]
+    except ValidationError as e:
+        raise _request_validation_error(e, loc, raw)
+
+
+def _request_validation_error(error: ValidationError, loc: tuple, body: Any) -> RequestValidationError:
+    """Re-root Pydantic errors under the request body, as FastAPI does for typed bodies."""
+    errors = [{**detail, "loc": loc + tuple(detail["loc"])} for detail in error.errors()]
+    return RequestValidationError(errors, body=body)
+
+
+async def _json_body(request: Request) -> Any:
+    """Decode the request body with orjson, mirroring FastAPI's 422 on bad JSON."""
+    body = await request.body()
+    try:
+        return orjson.loads(body)
+    except orjson.JSONDecodeError as e:
+        raise RequestValidationError(
+            [{"type": "json_invalid", "loc": ("body", e.pos), "msg": "JSON decode error",
+              "input": {}, "ctx": {"error": e.msg}}],
+            body=body,
+        )
+
+
+SEARCH_BATCH_MAX = 32
+
+
+class QueryBatcher:
+    """Coalesces concurrent semantic searches into one semantic_search_batch call per index."""
+    
+    def __init__(self, window: float, max_batch: int = SEARCH_BATCH_MAX):
+        self.window = window
+        self.max_batch = max_batch
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+        self._inflight: set = set()
+    
+    def start(self):
+        self._worker = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        if self._worker:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+    
+    async def submit(self, index_name: str, request: SearchRequest) -> List[SearchResult]:
+        future = asyncio.get_running_loop().create_future()
+        query = {
+            "query": request.query,
+            "top_k": request.top_k,
+            "filter": request.filter,
+            "namespace": request.namespace
+        }
+        self._queue.put_nowait((index_name, query, future))
+        return await future
+    
+    async def _run(self):
+        while True:
+            batch = [await self._queue.get()]
+            # Let requests already scheduled on the loop enqueue. A lone query is
+            # flushed right away; only when others are queued behind it is the
+            # window spent waiting for more
+            await asyncio.sleep(0)
+            if not self._queue.empty():
+                await asyncio.sleep(self.window)
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            
+            groups: Dict[str, list] = {}
+            for index_name, query, future in batch:
+                groups.setdefault(index_name, []).append((query, future))
+            
+            # Flush in the background so the next window can start collecting
+            for index_name, items in groups.items():
+                task = asyncio.create_task(self._flush(index_name, items))
+                self._inflight.add(task)
+                task.add_done_callback(self._inflight.discard)
+    
+    async def _flush(self, index_name: str, items: list):
+        try:
+            if not search_agent:
+                raise HTTPException(status_code=503, detail="Search agent not initialized")
+            results = await search_agent.semantic_search_batch(index_name, [query for query, _ in items])
+        except Exception as e:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for (_, future), result in zip(items, results):
+            if not future.done():
+                future.set_result(result)
+
+
 # Global search agent instance
 search_agent: Optional[SearchAgent] = None
+query_batcher: Optional[QueryBatcher] = None
+ingest_semaphore: Optional[asyncio.Semaphore] = None
+
+# Body of the 503 every endpoint returns while the agent is down, encoded once
+_NOT_READY_BODY = orjson.dumps({"detail": "Search agent not initialized"})
+
+
+def _not_ready() -> Response:
+    """Build a fresh 503 response.
+    
+    FastAPI attaches the request's BackgroundTasks to any returned response
+    without its own, so a shared instance would carry tasks between requests.
+    """
+    return Response(content=_NOT_READY_BODY, status_code=503, media_type="application/json")
+
+
+async def _guarded_ingest(index_name: str, documents: List[Dict[str, Any]], batch_size: int, namespace: Optional[str]):
+    """Run a background batch ingest, bounded by ingest_semaphore."""
+    if ingest_semaphore is None:
+        return await search_agent.batch_ingest(index_name, documents, batch_size, namespace)
+    async with ingest_semaphore:
+        return await search_agent.batch_ingest(index_name, documents, batch_size, namespace)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
-    global search_agent
+    global search_agent, query_batcher, ingest_semaphore
     
-    # Get API key from environment
-    pinecone_api_key = os.getenv("PINECONE_API_KEY")
+    # Settings are read once at import; handlers use app.state.settings
+    settings = app.state.settings
     
     # Configure for different store types
     store_configs = {
         VectorStoreType.PINECONE: {
-            "api_key": pinecone_api_key,
-            "environment": os.getenv("PINECONE_ENVIRONMENT", "us-east-1")
+            "api_key": settings.pinecone_api_key,
+            "environment": settings.pinecone_environment
         },
         VectorStoreType.PINECONE_MCP: {
             # MCP uses environment variables automatically
         },
         VectorStoreType.QDRANT: {
-            "host": os.getenv("QDRANT_HOST", "localhost"),
-            "port": int(os.getenv("QDRANT_PORT", "6333")),
-            "api_key": os.getenv("QDRANT_API_KEY")
+            "host": settings.qdrant_host,
+            "port": settings.qdrant_port,
+            "api_key": settings.qdrant_api_key
         }
     }
     
@@ -104,17 +434,37 @@ async def lifespan(app: FastAPI):
     # Store configs for easy switching
     search_agent._store_configs = store_configs
     
+    ingest_semaphore = asyncio.Semaphore(settings.max_concurrent_ingests)
+    _available_stores_payloads.clear()
+    
+    if settings.search_batch_window_ms > 0:
+        query_batcher = QueryBatcher(settings.search_batch_window_ms / 1000)
+        query_batcher.start()
+    
+    # Warm up lazily built state so the first requests don't pay for it.
+    # Pydantic v2 compiles validators at class creation; FastAPI's OpenAPI
+    # schema and the available-stores payload are built on first use.
+    app.openapi()
+    _available_stores_payloads[default_store_type.value] = _build_available_stores()
+    
     yield
     # Shutdown
+    if query_batcher:
+        await query_batcher.stop()
+        query_batcher = None
+    ingest_semaphore = None
     search_agent = None
+    _available_stores_payloads.clear()
 
 
 app = FastAPI(
     title="Vector Search Agent API",
     description="A Python-based search agent using Pinecone as vector store with support for semantic and hybrid search",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
+app.state.settings = settings
 
 # Add CORS middleware
 app.add_middleware(
@@ -125,12 +475,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Accept gzip-compressed ingest payloads (see examples/pdf_ingestion.py --compress)
+app.add_middleware(GzipRequestMiddleware, max_body_bytes=settings.max_request_body_bytes)
+
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
     if not search_agent:
-        raise HTTPException(status_code=503, detail="Search agent not initialized")
+        return _not_ready()
     return await search_agent.health_check()
 
 
@@ -138,7 +491,7 @@ async def health_check():
 async def list_indexes():
     """List all available indexes."""
     if not search_agent:
-        raise HTTPException(status_code=503, detail="Search agent not initialized")
+        return _not_ready()
     
     try:
         indexes = await search_agent.list_indexes()
@@ -151,7 +504,7 @@ async def list_indexes():
 async def create_index(request: IndexCreateRequest):
     """Create a new vector index."""
     if not search_agent:
-        raise HTTPException(status_code=503, detail="Search agent not initialized")
+        return _not_ready()
     
     try:
         success = await search_agent.create_index(
@@ -173,7 +526,7 @@ async def create_index(request: IndexCreateRequest):
 async def delete_index(index_name: str):
     """Delete a vector index."""
     if not search_agent:
-        raise HTTPException(status_code=503, detail="Search agent not initialized")
+        return _not_ready()
     
     try:
         success = await search_agent.delete_index(index_name)
@@ -189,7 +542,7 @@ async def delete_index(index_name: str):
 async def get_index_stats(index_name: str):
     """Get statistics about an index."""
     if not search_agent:
-        raise HTTPException(status_code=503, detail="Search agent not initialized")
+        return _not_ready()
     
     try:
         stats = await search_agent.get_index_stats(index_name)
@@ -198,72 +551,99 @@ async def get_index_stats(index_name: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/indexes/{index_name}/documents")
-async def ingest_documents(index_name: str, documents: List[DocumentInput], namespace: Optional[str] = None):
+@app.post(
+    "/indexes/{index_name}/documents",
+    openapi_extra={"requestBody": {"required": True, "content": {"application/json": {"schema": _DOCUMENT_LIST.json_schema()}}}},
+)
+async def ingest_documents(index_name: str, request: Request, namespace: Optional[str] = None):
     """Ingest documents into the vector store."""
     if not search_agent:
-        raise HTTPException(status_code=503, detail="Search agent not initialized")
+        return _not_ready()
+    
+    # Decode straight to dicts instead of building and dumping DocumentInput models
+    doc_dicts = _document_dicts(await _json_body(request))
     
     try:
-        # Convert Pydantic models to dicts
-        doc_dicts = [doc.model_dump() for doc in documents]
         success = await search_agent.ingest_documents(index_name, doc_dicts, namespace)
         if success:
-            return {"message": f"Successfully ingested {len(documents)} documents"}
+            return {"message": f"Successfully ingested {len(doc_dicts)} documents"}
         else:
             raise HTTPException(status_code=400, detail="Failed to ingest documents")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/indexes/{index_name}/documents/batch")
-async def batch_ingest_documents(index_name: str, request: BatchIngestRequest, background_tasks: BackgroundTasks):
+@app.post(
+    "/indexes/{index_name}/documents/batch",
+    openapi_extra={"requestBody": {"required": True, "content": {"application/json": {"schema": BatchIngestRequest.model_json_schema()}}}},
+)
+async def batch_ingest_documents(index_name: str, request: Request, background_tasks: BackgroundTasks):
     """Ingest documents in batches (background task)."""
     if not search_agent:
-        raise HTTPException(status_code=503, detail="Search agent not initialized")
+        return _not_ready()
+    
+    raw = await _json_body(request)
+    if (
+        type(raw) is dict
+        and "documents" in raw
+        and type(raw.get("index_name")) is str
+        and type(raw.get("batch_size", 100)) is int
+        and (raw.get("namespace") is None or type(raw["namespace"]) is str)
+    ):
+        doc_dicts = _document_dicts(raw["documents"], ("body", "documents"))
+        batch_size = raw.get("batch_size", 100)
+        namespace = raw.get("namespace")
+    else:
+        try:
+            parsed = BatchIngestRequest.model_validate(raw)
+        except ValidationError as e:
+            raise _request_validation_error(e, ("body",), raw)
+        doc_dicts = [doc.model_dump() for doc in parsed.documents]
+        batch_size = parsed.batch_size
+        namespace = parsed.namespace
     
     try:
-        # Convert Pydantic models to dicts
-        doc_dicts = [doc.model_dump() for doc in request.documents]
-        
         # Add background task for batch ingestion
         background_tasks.add_task(
-            search_agent.batch_ingest,
+            _guarded_ingest,
             index_name,
             doc_dicts,
-            request.batch_size,
-            request.namespace
+            batch_size,
+            namespace
         )
         
-        return {"message": f"Batch ingestion of {len(request.documents)} documents started"}
+        return {"message": f"Batch ingestion of {len(doc_dicts)} documents started"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/indexes/{index_name}/search/semantic")
-async def semantic_search(index_name: str, request: SearchRequest):
+@app.post("/indexes/{index_name}/search/semantic", response_model=None)
+async def semantic_search(index_name: str, request: SearchRequest, accept: Optional[str] = Header(None)):
     """Perform semantic search."""
     if not search_agent:
-        raise HTTPException(status_code=503, detail="Search agent not initialized")
+        return _not_ready()
     
     try:
-        results = await search_agent.semantic_search(
-            index_name=index_name,
-            query=request.query,
-            top_k=request.top_k,
-            filter=request.filter,
-            namespace=request.namespace
-        )
-        return {"results": [result.model_dump() for result in results]}
+        if query_batcher:
+            results = await query_batcher.submit(index_name, request)
+        else:
+            results = await search_agent.semantic_search(
+                index_name=index_name,
+                query=request.query,
+                top_k=request.top_k,
+                filter=request.filter,
+                namespace=request.namespace
+            )
+        return await _results_response(results, accept)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/indexes/{index_name}/search/hybrid")
-async def hybrid_search(index_name: str, request: HybridSearchRequest):
+@app.post("/indexes/{index_name}/search/hybrid", response_model=None)
+async def hybrid_search(index_name: str, request: HybridSearchRequest, accept: Optional[str] = Header(None)):
     """Perform hybrid search combining semantic and keyword search."""
     if not search_agent:
-        raise HTTPException(status_code=503, detail="Search agent not initialized")
+        return _not_ready()
     
     try:
         results = await search_agent.hybrid_search(
@@ -276,16 +656,16 @@ async def hybrid_search(index_name: str, request: HybridSearchRequest):
             rerank=request.rerank,
             rerank_top_n=request.rerank_top_n
         )
-        return {"results": [result.model_dump() for result in results]}
+        return await _results_response(results, accept)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/indexes/{index_name}/search/rerank")
-async def search_with_reranking(index_name: str, request: SearchWithRerankingRequest):
+@app.post("/indexes/{index_name}/search/rerank", response_model=None)
+async def search_with_reranking(index_name: str, request: SearchWithRerankingRequest, accept: Optional[str] = Header(None)):
     """Perform search with reranking for improved relevance."""
     if not search_agent:
-        raise HTTPException(status_code=503, detail="Search agent not initialized")
+        return _not_ready()
     
     try:
         results = await search_agent.search_with_reranking(
@@ -296,16 +676,16 @@ async def search_with_reranking(index_name: str, request: SearchWithRerankingReq
             filter=request.filter,
             namespace=request.namespace
         )
-        return {"results": [result.model_dump() for result in results]}
+        return await _results_response(results, accept)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/search/cascading")
-async def cascading_search(request: CascadingSearchRequest):
+@app.post("/search/cascading", response_model=None)
+async def cascading_search(request: CascadingSearchRequest, accept: Optional[str] = Header(None)):
     """Perform cascading search across multiple indexes."""
     if not search_agent:
-        raise HTTPException(status_code=503, detail="Search agent not initialized")
+        return _not_ready()
     
     try:
         results = await search_agent.cascading_search(
@@ -315,16 +695,16 @@ async def cascading_search(request: CascadingSearchRequest):
             filter=request.filter,
             rerank_top_n=request.rerank_top_n
         )
-        return {"results": [result.model_dump() for result in results]}
+        return await _results_response(results, accept)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/indexes/{index_name}/search/similarity")
-async def similarity_search_with_threshold(index_name: str, request: SimilaritySearchRequest):
+@app.post("/indexes/{index_name}/search/similarity", response_model=None)
+async def similarity_search_with_threshold(index_name: str, request: SimilaritySearchRequest, accept: Optional[str] = Header(None)):
     """Perform similarity search with a minimum threshold."""
     if not search_agent:
-        raise HTTPException(status_code=503, detail="Search agent not initialized")
+        return _not_ready()
     
     try:
         results = await search_agent.similarity_search_with_threshold(
@@ -335,16 +715,27 @@ async def similarity_search_with_threshold(index_name: str, request: SimilarityS
             filter=request.filter,
             namespace=request.namespace
         )
-        return {"results": [result.model_dump() for result in results]}
+        return await _results_response(results, accept)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.delete("/indexes/{index_name}/documents")
-async def delete_documents(index_name: str, document_ids: List[str], namespace: Optional[str] = None):
+@app.delete(
+    "/indexes/{index_name}/documents",
+    openapi_extra={"requestBody": {"required": True, "content": {"application/json": {"schema": {**_ID_LIST.json_schema(), "title": "Document Ids"}}}}},
+)
+async def delete_documents(index_name: str, request: Request, namespace: Optional[str] = None):
     """Delete documents from the vector store."""
     if not search_agent:
-        raise HTTPException(status_code=503, detail="Search agent not initialized")
+        return _not_ready()
+    
+    # A list of plain strings skips per-element Pydantic validation
+    document_ids = await _json_body(request)
+    if type(document_ids) is not list or not all(type(doc_id) is str for doc_id in document_ids):
+        try:
+            document_ids = _ID_LIST.validate_python(document_ids)
+        except ValidationError as e:
+            raise _request_validation_error(e, ("body",), document_ids)
     
     try:
         success = await search_agent.delete_documents(index_name, document_ids, namespace)
@@ -360,12 +751,28 @@ async def delete_documents(index_name: str, document_ids: List[str], namespace:
 async def switch_vector_store(store_type: VectorStoreType, store_config: Optional[Dict[str, Any]] = None):
     """Switch to a different vector store implementation."""
     if not search_agent:
-        raise HTTPException(status_code=503, detail="Search agent not initialized")
+        return _not_ready()
     
     try:
+        default_config = search_agent._store_configs.get(store_type, {})
+        
+        # Already on the requested backend with its stored config; avoid
+        # re-initializing the store. A custom config from an earlier switch
+        # still falls through and is reset to the stored one
+        if (
+            store_config is None
+            and store_type == search_agent.store_type
+            and search_agent.store_config == default_config
+        ):
+            return {
+                "message": f"Already using {store_type.value} vector store",
+                "store_type": store_type.value,
+                "config_used": bool(search_agent.store_config)
+            }
+
         # Use provided config or fall back to stored configs
-        if store_config is None and hasattr(search_agent, '_store_configs'):
-            store_config = search_agent._store_configs.get(store_type, {})
+        if store_config is None:
+            store_config = default_config
         
         search_agent.switch_vector_store(store_type, store_config)
         return {
@@ -377,58 +784,61 @@ async def switch_vector_store(store_type: VectorStoreType, store_config: Optiona
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/config/available-stores")
-async def get_available_stores():
-    """Get information about available vector store backends."""
-    stores = {
-        "pinecone": {
-            "name": "Pinecone (Direct API)",
-            "description": "Direct integration with Pinecone using pinecone-client",
-            "requires": ["PINECONE_API_KEY"],
-            "optional": ["PINECONE_ENVIRONMENT"]
-        },
-        "pinecone_mcp": {
-            "name": "Pinecone (MCP)",
-            "description": "Pinecone integration via Model Context Protocol",
-            "requires": ["PINECONE_API_KEY"],
-            "features": ["integrated_inference", "advanced_reranking", "cascading_search"]
-        },
-        "pinecone_mcp_enhanced": {
-            "name": "Pinecone (MCP Enhanced)",
-            "description": "Pinecone integration via Model Context Protocol with enhanced features",
-            "requires": ["PINECONE_API_KEY"],
-            "features": ["integrated_inference", "advanced_reranking", "cascading_search"]
-        },
-        "qdrant": {
-            "name": "Qdrant",
-            "description": "Open-source vector database alternative",
-            "requires": ["QDRANT_HOST"],
-            "optional": ["QDRANT_PORT"]
-        }
+# Static description of the supported backends
+STORE_CATALOG = {
+    "pinecone": {
+        "name": "Pinecone (Direct API)",
+        "description": "Direct integration with Pinecone using pinecone-client",
+        "requires": ["PINECONE_API_KEY"],
+        "optional": ["PINECONE_ENVIRONMENT"]
+    },
+    "pinecone_mcp": {
+        "name": "Pinecone (MCP)",
+        "description": "Pinecone integration via Model Context Protocol",
+        "requires": ["PINECONE_API_KEY"],
+        "features": ["integrated_inference", "advanced_reranking", "cascading_search"]
+    },
+    "pinecone_mcp_enhanced": {
+        "name": "Pinecone (MCP Enhanced)",
+        "description": "Pinecone integration via Model Context Protocol with enhanced features",
+        "requires": ["PINECONE_API_KEY"],
+        "features": ["integrated_inference", "advanced_reranking", "cascading_search"]
+    },
+    "qdrant": {
+        "name": "Qdrant",
+        "description": "Open-source vector database alternative",
+        "requires": ["QDRANT_HOST"],
+        "optional": ["QDRANT_PORT"]
     }
+}
+
+_STORE_TYPES_BY_VALUE = {store_type.value: store_type for store_type in VectorStoreType}
+
+# Serialized /config/available-stores payloads keyed by the current store type;
+# the configs and settings they read only change at startup
+_available_stores_payloads: Dict[Optional[str], bytes] = {}
+
+
+def _build_available_stores() -> bytes:
+    """Compute the available-stores payload for the current agent state."""
+    store_configs = search_agent._store_configs if search_agent else {}
+    pinecone_api_key = app.state.settings.pinecone_api_key
     
     # Check which stores are properly configured
     configured_stores = {}
-    for store_key, store_info in stores.items():
-        # Safely resolve config for known enum keys; tolerate extras
-        if hasattr(search_agent, "_store_configs"):
-            try:
-                enum_key = VectorStoreType(store_key)
-                config = search_agent._store_configs.get(enum_key, {})
-            except ValueError:
-                config = {}
-        else:
-            config = {}
+    for store_key, store_info in STORE_CATALOG.items():
+        # Catalog entries without a matching VectorStoreType (aliases) have no config
+        config = store_configs.get(_STORE_TYPES_BY_VALUE.get(store_key), {})
 
         # Determine if store is configured
         if store_key == "pinecone":
             config_available = bool(config.get("api_key"))
         elif store_key == "pinecone_mcp":
             # MCP path depends on env API key
-            config_available = bool(os.getenv("PINECONE_API_KEY"))
+            config_available = bool(pinecone_api_key)
         elif store_key == "pinecone_mcp_enhanced":
             # Treat as alias of MCP for config purposes
-            config_available = bool(os.getenv("PINECONE_API_KEY"))
+            config_available = bool(pinecone_api_key)
         elif store_key == "qdrant":
             config_available = bool(config.get("host"))
         else:
@@ -440,9 +850,27 @@ async def get_available_stores():
             "current": (search_agent.store_type.value == store_key) if search_agent else False,
         }
     
-    return {"stores": configured_stores}
+    return orjson.dumps({"stores": configured_stores})
+
+
+@app.get("/config/available-stores")
+async def get_available_stores():
+    """Get information about available vector store backends."""
+    current = search_agent.store_type.value if search_agent else None
+    payload = _available_stores_payloads.get(current)
+    if payload is None:
+        payload = _available_stores_payloads[current] = _build_available_stores()
+    return Response(content=payload, media_type="application/json")
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
+    # "auto" picks uvloop and httptools when installed; every worker runs its own lifespan
+    uvicorn.run(
+        "src.api:app",
+        host=settings.api_host,
+        port=settings.api_port,
+        workers=settings.api_workers,
+        loop="auto",
+        http="auto"
+    )
@@ -7,39 +7,76 @@ evidence archives, comparison reports, and audit trails.
 """
 
 import os
+import re
 import json
 import hashlib
+import tempfile
 from datetime import datetime
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from pathlib import Path
-import difflib
 
 try:
-    from .policy_types import PolicyArtifacts, SpecDSL, spec_dsl_to_json
+    import orjson
 except ImportError:
-    from policy_types import PolicyArtifacts, SpecDSL, spec_dsl_to_json
+    orjson = None
+
+try:
+    from .policy_types import Evidence, PolicyArtifacts, SpecDSL, spec_dsl_to_dict
+except ImportError:
+    from policy_types import Evidence, PolicyArtifacts, SpecDSL, spec_dsl_to_dict
+
+
+# Sessions kept in the global index after compaction
+INDEX_MAX_SESSIONS = 100
+# The index is compacted once it holds this many sessions, so a rewrite happens
+# once per INDEX_MAX_SESSIONS saves rather than on every save
+INDEX_COMPACT_SESSIONS = 2 * INDEX_MAX_SESSIONS
+# No index line is shorter than this (the keys alone take more), so smaller
+# files cannot have reached INDEX_COMPACT_SESSIONS and are not read back
+INDEX_MIN_LINE_BYTES = 128
+
+# Anything that is not alphanumeric, space, hyphen or underscore
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w \-]+')
+
+
+def _dump_json(obj: Any, default=None) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            default=default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+    return json.dumps(obj, indent=2, default=default).encode()
+
+
+def _dump_json_line(obj: Any) -> bytes:
+    """Serialize to a single newline-terminated JSON line."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, default=str) + "\n").encode()
 
 
 class ArtifactSaver:
     """Comprehensive artifact storage system with structured format and analysis."""
     
+    # Resolved output roots whose directory tree was already created in this process
+    _initialized_bases: set = set()
+    
     def __init__(self, base_output_dir: str = "outputs"):
         self.base_output_dir = Path(base_output_dir)
-        self.setup_directories()
+        base_key = self.base_output_dir.resolve()
+        if base_key not in ArtifactSaver._initialized_bases:
+            self.setup_directories()
+            ArtifactSaver._initialized_bases.add(base_key)
     
     def setup_directories(self):
         """Create the structured output directory system."""
-        dirs = [
-            self.base_output_dir,
-            self.base_output_dir / "artifacts",
-            self.base_output_dir / "policies",  # Legacy format
-            self.base_output_dir / "logs",
-            self.base_output_dir / "comparisons",
-            self.base_output_dir / "evidence"
-        ]
+        self.base_output_dir.mkdir(parents=True, exist_ok=True)
         
-        for directory in dirs:
-            directory.mkdir(parents=True, exist_ok=True)
+        # Subdirectories sit directly under the base, so no parent walk is needed
+        for name in ("artifacts", "policies", "logs", "comparisons", "evidence"):  # policies: legacy format
+            (self.base_output_dir / name).mkdir(exist_ok=True)
     
     def save_artifacts(
         self, 
@@ -54,9 +91,14 @@ class ArtifactSaver:
         Returns:
             Dictionary with paths to all saved files
         """
+        # One clock read per session; every artifact carries the same timestamp
+        now = datetime.now()
+        created_at = now.isoformat()
+        generated = now.strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        
         # Generate session info
-        session_id = self._generate_session_id(original_prompt)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        session_id = self._generate_session_id(original_prompt, created_at)
         
         # Create session directory
         if custom_name:
@@ -70,49 +112,74 @@ class ArtifactSaver:
         
         saved_files = {}
         
+        # Serialize the SpecDSL once for both the master file and spec_dsl.json
+        spec_dsl_dict = self._serialize_spec_dsl(artifacts.spec_dsl)
+        # Master file, comparison report and audit trail share one policy comparison
+        analysis = self._analyze_policy_differences(
+            artifacts.baseline_policy, artifacts.candidate_policy
+        )
+        
         # 1. Save master artifacts file
         master_file = session_dir / "artifacts.json"
         master_data = self._build_master_artifacts_data(
-            artifacts, original_prompt, session_id, rag_context
+            artifacts, original_prompt, session_id, rag_context, spec_dsl_dict, analysis,
+            created_at
         )
         
-        with open(master_file, 'w') as f:
-            json.dump(master_data, f, indent=2, default=str)
+        self._write_json(master_file, master_data, default=str)
         saved_files["master"] = str(master_file)
         
         # 2. Save individual artifacts
-        saved_files.update(self._save_individual_artifacts(artifacts, session_dir))
+        saved_files.update(self._save_individual_artifacts(
+            artifacts, session_dir, spec_dsl_dict, generated
+        ))
         
         # 3. Save RAG context and evidence
         if rag_context:
-            evidence_file = self._save_evidence_archive(rag_context, session_dir, session_id)
+            evidence_file = self._save_evidence_archive(
+                rag_context, session_dir, session_id, created_at
+            )
             saved_files["evidence"] = evidence_file
         
         # 4. Generate and save comparison report
-        comparison_file = self._save_comparison_report(artifacts, session_dir)
+        comparison_file = self._save_comparison_report(artifacts, session_dir, analysis, generated)
         saved_files["comparison"] = comparison_file
         
         # 5. Save audit trail
-        audit_file = self._save_audit_trail(artifacts, original_prompt, session_dir)
+        audit_file = self._save_audit_trail(
+            artifacts, original_prompt, session_dir, analysis, created_at
+        )
         saved_files["audit"] = audit_file
         
         # 6. Create README for the session
-        readme_file = self._create_session_readme(artifacts, original_prompt, session_dir)
+        readme_file = self._create_session_readme(
+            artifacts, original_prompt, session_dir, generated
+        )
         saved_files["readme"] = readme_file
         
         # 7. Update global index
-        self._update_global_index(session_name, session_id, original_prompt, artifacts)
+        self._update_global_index(
+            session_name, session_id, original_prompt, artifacts, created_at
+        )
         
         return saved_files
     
-    def _generate_session_id(self, prompt: str) -> str:
+    def _write_json(self, path: Path, obj: Any, default=None):
+        """Write obj as indented JSON in a single write."""
+        with open(path, 'wb') as f:
+            f.write(_dump_json(obj, default=default))
+    
+    def _generate_session_id(self, prompt: str, created_at: Optional[str] = None) -> str:
         """Generate unique session ID from prompt and timestamp."""
-        content = f"{prompt}{datetime.now().isoformat()}"
-        return hashlib.sha256(content.encode()).hexdigest()[:12]
+        if created_at is None:
+            created_at = datetime.now().isoformat()
+        content = f"{prompt}{created_at}"
+        # 6-byte BLAKE2b digest gives the same 12 hex chars without truncating a sha256
+        return hashlib.blake2b(content.encode(), digest_size=6).hexdigest()
     
     def _sanitize_filename(self, text: str, max_length: int = 50) -> str:
         """Create safe filename from text."""
-        safe = "".join(c for c in text if c.isalnum() or c in (' ', '-', '_')).strip()
+        safe = _UNSAFE_FILENAME_CHARS.sub('', text).strip()
         safe = "_".join(safe.split())
         return safe[:max_length]
     
@@ -121,13 +188,24 @@ class ArtifactSaver:
         artifacts: PolicyArtifacts, 
         original_prompt: str, 
         session_id: str,
-        rag_context: List[Dict[str, Any]] = None
+        rag_context: List[Dict[str, Any]] = None,
+        spec_dsl_dict: Optional[Dict[str, Any]] = None,
+        analysis: Optional[Dict[str, Any]] = None,
+        created_at: Optional[str] = None
     ) -> Dict[str, Any]:
         """Build comprehensive master artifacts data structure."""
+        if created_at is None:
+            created_at = datetime.now().isoformat()
+        if spec_dsl_dict is None:
+            spec_dsl_dict = self._serialize_spec_dsl(artifacts.spec_dsl)
+        if analysis is None:
+            analysis = self._analyze_policy_differences(
+                artifacts.baseline_policy, artifacts.candidate_policy
+            )
         return {
             "metadata": {
                 "session_id": session_id,
-                "created_at": datetime.now().isoformat(),
+                "created_at": created_at,
                 "original_prompt": original_prompt,
                 "system_version": "4-artifact-v1.0",
                 "extraction_confidence": artifacts.extraction_confidence,
@@ -140,15 +218,13 @@ class ArtifactSaver:
                     "assumptions": artifacts.read_back.assumptions,
                     "risk_callouts": artifacts.read_back.risk_callouts
                 },
-                "spec_dsl": self._serialize_spec_dsl(artifacts.spec_dsl),
+                "spec_dsl": spec_dsl_dict,
                 "baseline_policy": artifacts.baseline_policy,
                 "candidate_policy": artifacts.candidate_policy
             },
             "analysis": {
-                "policy_comparison": self._analyze_policy_differences(
-                    artifacts.baseline_policy, artifacts.candidate_policy
-                ),
-                "evidence_count": len(self._extract_all_evidence(artifacts.spec_dsl)),
+                "policy_comparison": analysis,
+                "evidence_count": self._count_evidence(artifacts.spec_dsl),
                 "capability_count": len(artifacts.spec_dsl.capabilities),
                 "restriction_count": len(artifacts.spec_dsl.must_never) if artifacts.spec_dsl.must_never else 0
             },
@@ -161,9 +237,8 @@ class ArtifactSaver:
     def _serialize_spec_dsl(self, spec_dsl: SpecDSL) -> Dict[str, Any]:
         """Convert SpecDSL to serializable dictionary."""
         try:
-            # Use the existing serialization from policy_types
-            json_str = spec_dsl_to_json(spec_dsl)
-            return json.loads(json_str)
+            # Use the existing serialization from policy_types, without a JSON round trip
+            return spec_dsl_to_dict(spec_dsl)
         except Exception:
             # Fallback manual serialization
             return {
@@ -190,54 +265,60 @@ class ArtifactSaver:
                 ] if spec_dsl.must_never else None
             }
     
-    def _save_individual_artifacts(self, artifacts: PolicyArtifacts, session_dir: Path) -> Dict[str, str]:
+    def _save_individual_artifacts(
+        self,
+        artifacts: PolicyArtifacts,
+        session_dir: Path,
+        spec_dsl_dict: Optional[Dict[str, Any]] = None,
+        generated: Optional[str] = None
+    ) -> Dict[str, str]:
         """Save each artifact as individual files."""
         saved = {}
+        if generated is None:
+            generated = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        if spec_dsl_dict is None:
+            spec_dsl_dict = self._serialize_spec_dsl(artifacts.spec_dsl)
         
         # 1. ReadBack as Markdown
         readback_file = session_dir / "read_back.md"
-        with open(readback_file, 'w') as f:
-            f.write(f"# Policy Analysis Summary\n\n")
-            f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"**Extraction Confidence:** {artifacts.extraction_confidence:.1%}\n\n")
-            
-            f.write(f"## Summary\n\n{artifacts.read_back.summary}\n\n")
-            
-            if artifacts.read_back.bullets:
-                f.write(f"## Key Points\n\n")
-                for bullet in artifacts.read_back.bullets:
-                    f.write(f"- {bullet}\n")
-                f.write("\n")
-            
-            if artifacts.read_back.assumptions:
-                f.write(f"## Assumptions\n\n")
-                for assumption in artifacts.read_back.assumptions:
-                    f.write(f"- {assumption}\n")
-                f.write("\n")
-            
-            if artifacts.read_back.risk_callouts:
-                f.write(f"## Risk Callouts\n\n")
-                for risk in artifacts.read_back.risk_callouts:
-                    f.write(f"- {risk}\n")
+        parts = [
+            "# Policy Analysis Summary\n\n",
+            f"**Generated:** {generated}\n",
+            f"**Extraction Confidence:** {artifacts.extraction_confidence:.1%}\n\n",
+            f"## Summary\n\n{artifacts.read_back.summary}\n\n",
+        ]
+        
+        if artifacts.read_back.bullets:
+            parts.append("## Key Points\n\n")
+            parts.extend(f"- {bullet}\n" for bullet in artifacts.read_back.bullets)
+            parts.append("\n")
+        
+        if artifacts.read_back.assumptions:
+            parts.append("## Assumptions\n\n")
+            parts.extend(f"- {assumption}\n" for assumption in artifacts.read_back.assumptions)
+            parts.append("\n")
+        
+        if artifacts.read_back.risk_callouts:
+            parts.append("## Risk Callouts\n\n")
+            parts.extend(f"- {risk}\n" for risk in artifacts.read_back.risk_callouts)
+        
+        readback_file.write_text("".join(parts), encoding="utf-8")
         
         saved["read_back"] = str(readback_file)
         
         # 2. SpecDSL as JSON
         spec_file = session_dir / "spec_dsl.json"
-        with open(spec_file, 'w') as f:
-            json.dump(self._serialize_spec_dsl(artifacts.spec_dsl), f, indent=2)
+        self._write_json(spec_file, spec_dsl_dict)
         saved["spec_dsl"] = str(spec_file)
         
         # 3. Baseline Policy as JSON
         baseline_file = session_dir / "baseline_policy.json"
-        with open(baseline_file, 'w') as f:
-            json.dump(artifacts.baseline_policy, f, indent=2)
+        self._write_json(baseline_file, artifacts.baseline_policy)
         saved["baseline_policy"] = str(baseline_file)
         
         # 4. Candidate Policy as JSON
         candidate_file = session_dir / "candidate_policy.json"
-        with open(candidate_file, 'w') as f:
-            json.dump(artifacts.candidate_policy, f, indent=2)
+        self._write_json(candidate_file, artifacts.candidate_policy)
         saved["candidate_policy"] = str(candidate_file)
         
         return saved
@@ -246,104 +327,143 @@ class ArtifactSaver:
         self, 
         rag_context: List[Dict[str, Any]], 
         session_dir: Path, 
-        session_id: str
+        session_id: str,
+        created_at: Optional[str] = None
     ) -> str:
         """Save complete RAG context and evidence citations."""
         evidence_file = session_dir / "evidence_archive.json"
+        if created_at is None:
+            created_at = datetime.now().isoformat()
+        
+        # One pass over the context builds the archive entries and the summary totals
+        chunks = []
+        score_sum = 0
+        total_text_length = 0
+        content_types = set()
+        for i, chunk in enumerate(rag_context):
+            chunks.append(self._archive_chunk(i, chunk))
+            score_sum += chunk.get("score", 0)
+            total_text_length += len(chunk.get("text", ""))
+            content_types.add(chunk.get("metadata", {}).get("content_type", "unknown"))
         
         evidence_data = {
             "session_id": session_id,
-            "created_at": datetime.now().isoformat(),
+            "created_at": created_at,
             "rag_context": {
                 "total_chunks": len(rag_context),
-                "chunks": [
-                    {
-                        "index": i,
-                        "text": chunk.get("text", "")[:1000],  # Limit text length
-                        "score": chunk.get("score", 0),
-                        "metadata": chunk.get("metadata", {}),
-                        "text_hash": hashlib.md5(chunk.get("text", "").encode()).hexdigest()[:8]
-                    } for i, chunk in enumerate(rag_context)
-                ]
+                "chunks": chunks
             },
             "summary": {
-                "avg_score": sum(c.get("score", 0) for c in rag_context) / len(rag_context) if rag_context else 0,
-                "content_types": list(set(c.get("metadata", {}).get("content_type", "unknown") for c in rag_context)),
-                "total_text_length": sum(len(c.get("text", "")) for c in rag_context)
+                "avg_score": score_sum / len(rag_context) if rag_context else 0,
+                "content_types": list(content_types),
+                "total_text_length": total_text_length
             }
         }
         
-        with open(evidence_file, 'w') as f:
-            json.dump(evidence_data, f, indent=2)
+        self._write_json(evidence_file, evidence_data)
         
         return str(evidence_file)
     
-    def _save_comparison_report(self, artifacts: PolicyArtifacts, session_dir: Path) -> str:
+    @staticmethod
+    def _archive_chunk(index: int, chunk: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the evidence-archive entry for one RAG chunk."""
+        text = chunk.get("text", "")
+        return {
+            "index": index,
+            "text": text[:1000],  # Limit text length
+            "score": chunk.get("score", 0),
+            "metadata": chunk.get("metadata", {}),
+            # 8-hex-digit fingerprint; BLAKE2b with a 4-byte digest is cheaper than md5
+            "text_hash": hashlib.blake2b(text.encode(), digest_size=4).hexdigest()
+        }
+    
+    def _save_comparison_report(
+        self,
+        artifacts: PolicyArtifacts,
+        session_dir: Path,
+        analysis: Optional[Dict[str, Any]] = None,
+        generated: Optional[str] = None
+    ) -> str:
         """Generate and save detailed comparison between baseline and candidate policies."""
         comparison_file = session_dir / "policy_comparison.md"
         
         baseline = artifacts.baseline_policy
         candidate = artifacts.candidate_policy
         
-        analysis = self._analyze_policy_differences(baseline, candidate)
+        if analysis is None:
+            analysis = self._analyze_policy_differences(baseline, candidate)
         
-        with open(comparison_file, 'w') as f:
-            f.write(f"# Policy Comparison Report\n\n")
-            f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"**Baseline Confidence:** Deterministic (100%)\n")
-            f.write(f"**Candidate Confidence:** {artifacts.generation_confidence:.1%}\n\n")
+        if generated is None:
+            generated = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        parts = [
+            "# Policy Comparison Report\n\n",
+            f"**Generated:** {generated}\n",
+            "**Baseline Confidence:** Deterministic (100%)\n",
+            f"**Candidate Confidence:** {artifacts.generation_confidence:.1%}\n\n",
             
             # Executive Summary
-            f.write(f"## Executive Summary\n\n")
-            f.write(f"- **Baseline Statements:** {analysis['baseline_statement_count']}\n")
-            f.write(f"- **Candidate Statements:** {analysis['candidate_statement_count']}\n")
-            f.write(f"- **Statement Difference:** {analysis['statement_difference']}\n")
-            f.write(f"- **Actions Overlap:** {analysis['actions_overlap']:.1%}\n")
-            f.write(f"- **Resources Overlap:** {analysis['resources_overlap']:.1%}\n\n")
+            "## Executive Summary\n\n",
+            f"- **Baseline Statements:** {analysis['baseline_statement_count']}\n",
+            f"- **Candidate Statements:** {analysis['candidate_statement_count']}\n",
+            f"- **Statement Difference:** {analysis['statement_difference']}\n",
+            f"- **Actions Overlap:** {analysis['actions_overlap']:.1%}\n",
+            f"- **Resources Overlap:** {analysis['resources_overlap']:.1%}\n\n",
             
             # Detailed Analysis
-            f.write(f"## Detailed Analysis\n\n")
+            "## Detailed Analysis\n\n",
             
-            f.write(f"### Actions Comparison\n")
-            f.write(f"- **Baseline Only:** {', '.join(analysis['baseline_only_actions'][:10])}\n")
-            f.write(f"- **Candidate Only:** {', '.join(analysis['candidate_only_actions'][:10])}\n")
-            f.write(f"- **Common Actions:** {len(analysis['common_actions'])}\n\n")
+            "### Actions Comparison\n",
+            f"- **Baseline Only:** {', '.join(analysis['baseline_only_actions'][:10])}\n",
+            f"- **Candidate Only:** {', '.join(analysis['candidate_only_actions'][:10])}\n",
+            f"- **Common Actions:** {len(analysis['common_actions'])}\n\n",
             
-            f.write(f"### Resources Comparison\n")
-            f.write(f"- **Baseline Only:** {len(analysis['baseline_only_resources'])} resources\n")
-            f.write(f"- **Candidate Only:** {len(analysis['candidate_only_resources'])} resources\n")
-            f.write(f"- **Common Resources:** {len(analysis['common_resources'])}\n\n")
+            "### Resources Comparison\n",
+            f"- **Baseline Only:** {len(analysis['baseline_only_resources'])} resources\n",
+            f"- **Candidate Only:** {len(analysis['candidate_only_resources'])} resources\n",
+            f"- **Common Resources:** {len(analysis['common_resources'])}\n\n",
             
             # Side-by-side JSON
-            f.write(f"## Side-by-Side Policies\n\n")
-            f.write(f"### Baseline Policy\n```json\n")
-            f.write(json.dumps(baseline, indent=2))
-            f.write(f"\n```\n\n")
+            "## Side-by-Side Policies\n\n",
+            "### Baseline Policy\n```json\n",
+            _dump_json(baseline).decode(),
+            "\n```\n\n",
             
-            f.write(f"### Candidate Policy\n```json\n")
-            f.write(json.dumps(candidate, indent=2))
-            f.write(f"\n```\n\n")
+            "### Candidate Policy\n```json\n",
+            _dump_json(candidate).decode(),
+            "\n```\n\n",
             
             # Recommendations
-            f.write(f"## Recommendations\n\n")
-            if analysis['statement_difference'] > 2:
-                f.write(f"- ⚠️  Significant structural differences - review carefully\n")
-            if analysis['actions_overlap'] < 0.8:
-                f.write(f"- ⚠️  Low action overlap - verify intent alignment\n")
-            if analysis['candidate_statement_count'] == 0:
-                f.write(f"- ❌ Candidate policy is empty - baseline recommended\n")
-            if analysis['baseline_statement_count'] == 0:
-                f.write(f"- ⚠️  Baseline policy is empty - review SpecDSL\n")
+            "## Recommendations\n\n",
+        ]
+        if analysis['statement_difference'] > 2:
+            parts.append("- ⚠️  Significant structural differences - review carefully\n")
+        if analysis['actions_overlap'] < 0.8:
+            parts.append("- ⚠️  Low action overlap - verify intent alignment\n")
+        if analysis['candidate_statement_count'] == 0:
+            parts.append("- ❌ Candidate policy is empty - baseline recommended\n")
+        if analysis['baseline_statement_count'] == 0:
+            parts.append("- ⚠️  Baseline policy is empty - review SpecDSL\n")
+        
+        comparison_file.write_text("".join(parts), encoding="utf-8")
         
         return str(comparison_file)
     
-    def _save_audit_trail(self, artifacts: PolicyArtifacts, original_prompt: str, session_dir: Path) -> str:
+    def _save_audit_trail(
+        self,
+        artifacts: PolicyArtifacts,
+        original_prompt: str,
+        session_dir: Path,
+        analysis: Optional[Dict[str, Any]] = None,
+        created_at: Optional[str] = None
+    ) -> str:
         """Save complete audit trail with confidence scores and validation results."""
         audit_file = session_dir / "audit_trail.json"
+        if created_at is None:
+            created_at = datetime.now().isoformat()
         
         audit_data = {
             "metadata": {
-                "created_at": datetime.now().isoformat(),
+                "created_at": created_at,
                 "original_prompt": original_prompt,
                 "session_duration": "N/A"  # Could be calculated if we track start time
             },
@@ -351,7 +471,7 @@ class ArtifactSaver:
                 "confidence": artifacts.extraction_confidence,
                 "capabilities_extracted": len(artifacts.spec_dsl.capabilities),
                 "restrictions_extracted": len(artifacts.spec_dsl.must_never) if artifacts.spec_dsl.must_never else 0,
-                "evidence_citations": len(self._extract_all_evidence(artifacts.spec_dsl))
+                "evidence_citations": self._count_evidence(artifacts.spec_dsl)
             },
             "generation_metrics": {
                 "confidence": artifacts.generation_confidence,
@@ -366,69 +486,84 @@ class ArtifactSaver:
             "quality_metrics": {
                 "policy_complexity_baseline": self._calculate_policy_complexity(artifacts.baseline_policy),
                 "policy_complexity_candidate": self._calculate_policy_complexity(artifacts.candidate_policy),
-                "alignment_score": self._calculate_alignment_score(artifacts)
+                "alignment_score": self._calculate_alignment_score(artifacts, analysis)
             }
         }
         
-        with open(audit_file, 'w') as f:
-            json.dump(audit_data, f, indent=2)
+        self._write_json(audit_file, audit_data)
         
         return str(audit_file)
     
-    def _create_session_readme(self, artifacts: PolicyArtifacts, original_prompt: str, session_dir: Path) -> str:
+    def _create_session_readme(
+        self,
+        artifacts: PolicyArtifacts,
+        original_prompt: str,
+        session_dir: Path,
+        generated: Optional[str] = None
+    ) -> str:
         """Create README file explaining the session contents."""
         readme_file = session_dir / "README.md"
-        
-        with open(readme_file, 'w') as f:
-            f.write(f"# Policy Generation Session\n\n")
-            f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"**Original Prompt:** {original_prompt}\n\n")
+        if generated is None:
+            generated = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        
+        restriction_count = len(artifacts.spec_dsl.must_never) if artifacts.spec_dsl.must_never else 0
+        readme = (
+            "# Policy Generation Session\n\n"
+            f"**Generated:** {generated}\n"
+            f"**Original Prompt:** {original_prompt}\n\n"
             
-            f.write(f"## Contents\n\n")
-            f.write(f"This directory contains a complete four-artifact policy generation session:\n\n")
-            f.write(f"### Core Artifacts\n")
-            f.write(f"- `artifacts.json` - Master file with all artifacts and metadata\n")
-            f.write(f"- `read_back.md` - Human-readable summary and analysis\n")
-            f.write(f"- `spec_dsl.json` - Machine-readable intent specification\n")
-            f.write(f"- `baseline_policy.json` - Deterministic policy from canonizer\n")
-            f.write(f"- `candidate_policy.json` - LLM-generated policy\n\n")
+            "## Contents\n\n"
+            "This directory contains a complete four-artifact policy generation session:\n\n"
+            "### Core Artifacts\n"
+            "- `artifacts.json` - Master file with all artifacts and metadata\n"
+            "- `read_back.md` - Human-readable summary and analysis\n"
+            "- `spec_dsl.json` - Machine-readable intent specification\n"
+            "- `baseline_policy.json` - Deterministic policy from canonizer\n"
+            "- `candidate_policy.json` - LLM-generated policy\n\n"
             
-            f.write(f"### Analysis & Context\n")
-            f.write(f"- `policy_comparison.md` - Side-by-side policy analysis\n")
-            f.write(f"- `evidence_archive.json` - RAG context and citations\n")
-            f.write(f"- `audit_trail.json` - Confidence scores and metrics\n")
-            f.write(f"- `README.md` - This file\n\n")
+            "### Analysis & Context\n"
+            "- `policy_comparison.md` - Side-by-side policy analysis\n"
+            "- `evidence_archive.json` - RAG context and citations\n"
+            "- `audit_trail.json` - Confidence scores and metrics\n"
+            "- `README.md` - This file\n\n"
             
-            f.write(f"## Quick Stats\n\n")
-            f.write(f"- **Extraction Confidence:** {artifacts.extraction_confidence:.1%}\n")
-            f.write(f"- **Generation Confidence:** {artifacts.generation_confidence:.1%}\n")
-            f.write(f"- **Capabilities:** {len(artifacts.spec_dsl.capabilities)}\n")
-            f.write(f"- **Restrictions:** {len(artifacts.spec_dsl.must_never) if artifacts.spec_dsl.must_never else 0}\n")
-            f.write(f"- **Baseline Statements:** {len(artifacts.baseline_policy.get('Statement', []))}\n")
-            f.write(f"- **Candidate Statements:** {len(artifacts.candidate_policy.get('Statement', []))}\n\n")
+            "## Quick Stats\n\n"
+            f"- **Extraction Confidence:** {artifacts.extraction_confidence:.1%}\n"
+            f"- **Generation Confidence:** {artifacts.generation_confidence:.1%}\n"
+            f"- **Capabilities:** {len(artifacts.spec_dsl.capabilities)}\n"
+            f"- **Restrictions:** {restriction_count}\n"
+            f"- **Baseline Statements:** {len(artifacts.baseline_policy.get('Statement', []))}\n"
+            f"- **Candidate Statements:** {len(artifacts.candidate_policy.get('Statement', []))}\n\n"
             
-            f.write(f"## Usage\n\n")
-            f.write(f"1. Review `read_back.md` for human understanding\n")
-            f.write(f"2. Check `policy_comparison.md` for differences analysis\n")
-            f.write(f"3. Deploy `baseline_policy.json` for safety or `candidate_policy.json` if validated\n")
-            f.write(f"4. Reference `evidence_archive.json` for source documentation\n")
+            "## Usage\n\n"
+            "1. Review `read_back.md` for human understanding\n"
+            "2. Check `policy_comparison.md` for differences analysis\n"
+            "3. Deploy `baseline_policy.json` for safety or `candidate_policy.json` if validated\n"
+            "4. Reference `evidence_archive.json` for source documentation\n"
+        )
+        readme_file.write_text(readme, encoding="utf-8")
         
         return str(readme_file)
     
-    def _update_global_index(self, session_name: str, session_id: str, prompt: str, artifacts: PolicyArtifacts):
-        """Update global index of all sessions."""
-        index_file = self.base_output_dir / "session_index.json"
-        
-        try:
-            with open(index_file, 'r') as f:
-                index = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            index = {"sessions": []}
+    def _update_global_index(
+        self,
+        session_name: str,
+        session_id: str,
+        prompt: str,
+        artifacts: PolicyArtifacts,
+        created_at: Optional[str] = None
+    ):
+        """Append this session to the global index (one JSON object per line)."""
+        index_file = self.base_output_dir / "session_index.jsonl"
+        if created_at is None:
+            created_at = datetime.now().isoformat()
+        if not index_file.exists():
+            self._migrate_legacy_index(index_file)
         
         session_entry = {
             "session_id": session_id,
             "session_name": session_name,
-            "created_at": datetime.now().isoformat(),
+            "created_at": created_at,
             "prompt": prompt[:100] + "..." if len(prompt) > 100 else prompt,
             "extraction_confidence": artifacts.extraction_confidence,
             "generation_confidence": artifacts.generation_confidence,
@@ -436,13 +571,40 @@ class ArtifactSaver:
             "restrictions": len(artifacts.spec_dsl.must_never) if artifacts.spec_dsl.must_never else 0
         }
         
-        index["sessions"].append(session_entry)
+        with open(index_file, 'ab') as f:
+            f.write(_dump_json_line(session_entry))
+            index_size = f.tell()
         
-        # Keep only last 100 sessions
-        index["sessions"] = index["sessions"][-100:]
+        if index_size >= INDEX_COMPACT_SESSIONS * INDEX_MIN_LINE_BYTES:
+            self._compact_index(index_file)
+    
+    def _compact_index(self, index_file: Path):
+        """Trim the index to the most recent INDEX_MAX_SESSIONS sessions once it reaches INDEX_COMPACT_SESSIONS.
         
-        with open(index_file, 'w') as f:
-            json.dump(index, f, indent=2)
+        The trigger is the file's own line count, so the bound holds no matter how
+        many processes have appended to it.
+        """
+        with open(index_file, 'rb') as f:
+            data = f.read()
+        if data.count(b"\n") < INDEX_COMPACT_SESSIONS:
+            return
+        # A unique temp name keeps concurrent savers from writing the same file
+        with tempfile.NamedTemporaryFile(
+            dir=index_file.parent, prefix=f"{index_file.name}.", suffix=".tmp", delete=False
+        ) as f:
+            f.writelines(data.splitlines(keepends=True)[-INDEX_MAX_SESSIONS:])
+        os.replace(f.name, index_file)
+    
+    def _migrate_legacy_index(self, index_file: Path):
+        """Carry sessions over from the older rewrite-the-list session_index.json."""
+        legacy_file = self.base_output_dir / "session_index.json"
+        try:
+            with open(legacy_file, 'rb') as f:
+                sessions = json.loads(f.read()).get("sessions", [])
+        except (FileNotFoundError, json.JSONDecodeError, AttributeError):
+            return
+        with open(index_file, 'wb') as f:
+            f.writelines(_dump_json_line(entry) for entry in sessions[-INDEX_MAX_SESSIONS:])
     
     # Helper methods for analysis
     def _analyze_policy_differences(self, baseline: Dict[str, Any], candidate: Dict[str, Any]) -> Dict[str, Any]:
@@ -450,35 +612,13 @@ class ArtifactSaver:
         baseline_statements = baseline.get("Statement", [])
         candidate_statements = candidate.get("Statement", [])
         
-        baseline_actions = set()
-        candidate_actions = set()
-        baseline_resources = set()
-        candidate_resources = set()
-        
-        for stmt in baseline_statements:
-            actions = stmt.get("Action", [])
-            if isinstance(actions, str):
-                actions = [actions]
-            baseline_actions.update(actions)
-            
-            resources = stmt.get("Resource", [])
-            if isinstance(resources, str):
-                resources = [resources]
-            baseline_resources.update(resources)
-        
-        for stmt in candidate_statements:
-            actions = stmt.get("Action", [])
-            if isinstance(actions, str):
-                actions = [actions]
-            candidate_actions.update(actions)
-            
-            resources = stmt.get("Resource", [])
-            if isinstance(resources, str):
-                resources = [resources]
-            candidate_resources.update(resources)
+        baseline_actions, baseline_resources = self._collect_actions_and_resources(baseline_statements)
+        candidate_actions, candidate_resources = self._collect_actions_and_resources(candidate_statements)
         
         common_actions = baseline_actions & candidate_actions
         common_resources = baseline_resources & candidate_resources
+        all_actions = baseline_actions | candidate_actions
+        all_resources = baseline_resources | candidate_resources
         
         return {
             "baseline_statement_count": len(baseline_statements),
@@ -489,44 +629,44 @@ class ArtifactSaver:
             "common_actions": list(common_actions),
             "baseline_only_actions": list(baseline_actions - candidate_actions),
             "candidate_only_actions": list(candidate_actions - baseline_actions),
-            "actions_overlap": len(common_actions) / max(len(baseline_actions | candidate_actions), 1),
+            "actions_overlap": len(common_actions) / max(len(all_actions), 1),
             "baseline_resources": list(baseline_resources),
             "candidate_resources": list(candidate_resources),
             "common_resources": list(common_resources),
             "baseline_only_resources": list(baseline_resources - candidate_resources),
             "candidate_only_resources": list(candidate_resources - baseline_resources),
-            "resources_overlap": len(common_resources) / max(len(baseline_resources | candidate_resources), 1)
+            "resources_overlap": len(common_resources) / max(len(all_resources), 1)
         }
     
-    def _extract_all_evidence(self, spec_dsl: SpecDSL) -> List[Dict[str, Any]]:
-        """Extract all evidence citations from SpecDSL."""
-        evidence = []
+    @staticmethod
+    def _collect_actions_and_resources(statements: List[Dict[str, Any]]) -> Tuple[set, set]:
+        """Gather the actions and resources of a policy's statements in one pass."""
+        actions = set()
+        resources = set()
+        for stmt in statements:
+            stmt_actions = stmt.get("Action", ())
+            stmt_resources = stmt.get("Resource", ())
+            actions.update((stmt_actions,) if isinstance(stmt_actions, str) else stmt_actions)
+            resources.update((stmt_resources,) if isinstance(stmt_resources, str) else stmt_resources)
+        return actions, resources
+    
+    @staticmethod
+    def _iter_evidence(spec_dsl: SpecDSL) -> Iterator[Evidence]:
+        """Yield every evidence citation in the SpecDSL, capabilities then their conditions."""
         for cap in spec_dsl.capabilities:
-            for ev in cap.evidence:
-                evidence.append({
-                    "doc_url": ev.doc_url,
-                    "confidence": ev.confidence,
-                    "rationale": ev.rationale,
-                    "capability": cap.name
-                })
+            yield from cap.evidence
             if cap.conditions:
                 for cond in cap.conditions:
-                    for ev in cond.evidence:
-                        evidence.append({
-                            "doc_url": ev.doc_url,
-                            "confidence": ev.confidence,
-                            "rationale": ev.rationale,
-                            "condition": cond.key
-                        })
-        return evidence
+                    yield from cond.evidence
+    
+    @staticmethod
+    def _count_evidence(spec_dsl: SpecDSL) -> int:
+        """Count evidence citations in the SpecDSL without materializing them."""
+        return sum(1 for _ in ArtifactSaver._iter_evidence(spec_dsl))
     
     def _get_evidence_sources(self, spec_dsl: SpecDSL) -> List[str]:
         """Get unique evidence sources from SpecDSL."""
-        sources = set()
-        evidence = self._extract_all_evidence(spec_dsl)
-        for ev in evidence:
-            sources.add(ev["doc_url"])
-        return list(sources)
+        return list({ev.doc_url for ev in self._iter_evidence(spec_dsl)})
     
     def _calculate_policy_complexity(self, policy: Dict[str, Any]) -> int:
         """Calculate complexity score for a policy."""
@@ -551,12 +691,17 @@ class ArtifactSaver:
         
         return int(complexity)
     
-    def _calculate_alignment_score(self, artifacts: PolicyArtifacts) -> float:
+    def _calculate_alignment_score(
+        self,
+        artifacts: PolicyArtifacts,
+        analysis: Optional[Dict[str, Any]] = None
+    ) -> float:
         """Calculate alignment score between baseline and candidate."""
-        analysis = self._analyze_policy_differences(
-            artifacts.baseline_policy, 
-            artifacts.candidate_policy
-        )
+        if analysis is None:
+            analysis = self._analyze_policy_differences(
+                artifacts.baseline_policy, 
+                artifacts.candidate_policy
+            )
         
         # Weight different factors
         actions_weight = 0.4
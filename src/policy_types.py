@@ -230,8 +230,8 @@ def create_evidence(doc_url: str, confidence: int, rationale: str, quote: Option
     )
 
 
-def spec_dsl_to_json(spec: SpecDSL) -> str:
-    """Convert SpecDSL to JSON string."""
+def spec_dsl_to_dict(spec: SpecDSL) -> Dict[str, Any]:
+    """Convert SpecDSL to a plain JSON-compatible dictionary."""
     def _convert_dataclass(obj):
         if hasattr(obj, '__dataclass_fields__'):
             return {k: _convert_dataclass(v) for k, v in obj.__dict__.items()}
@@ -242,7 +242,12 @@ def spec_dsl_to_json(spec: SpecDSL) -> str:
         else:
             return obj
     
-    return json.dumps(_convert_dataclass(spec), indent=2)
+    return _convert_dataclass(spec)
+
+
+def spec_dsl_to_json(spec: SpecDSL) -> str:
+    """Convert SpecDSL to JSON string."""
+    return json.dumps(spec_dsl_to_dict(spec), indent=2)
 
 
 def json_to_spec_dsl(json_str: str) -> SpecDSL:
@@ -1,19 +1,18 @@
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Iterable, Optional, Union
 import asyncio
+import importlib
+import heapq
+import itertools
 from enum import Enum
 
 try:
     # Try relative imports first (when run as module)
     from .vector_store.base import VectorStore, Document, SearchResult, SearchRequest, SearchType
-    from .vector_store.pinecone_store import PineconeStore
     from .vector_store.pinecone_mcp_store import PineconeMCPStore
-    from .vector_store.qdrant_store import QdrantStore
 except ImportError:
     # Fall back to absolute imports (when run as script)
     from vector_store.base import VectorStore, Document, SearchResult, SearchRequest, SearchType
-    from vector_store.pinecone_store import PineconeStore
     from vector_store.pinecone_mcp_store import PineconeMCPStore
-    from vector_store.qdrant_store import QdrantStore
 
 
 class VectorStoreType(Enum):
@@ -22,6 +21,22 @@ class VectorStoreType(Enum):
     QDRANT = "qdrant"
 
 
+# Backends whose clients pull in heavy dependencies (pinecone-client, qdrant-client,
+# sentence-transformers) are imported only when first selected
+_LAZY_STORES = {
+    VectorStoreType.PINECONE: ("pinecone_store", "PineconeStore"),
+    VectorStoreType.QDRANT: ("qdrant_store", "QdrantStore"),
+}
+
+
+def _load_store_class(store_type: VectorStoreType) -> type:
+    """Import and return the store class for a lazily loaded backend."""
+    module_name, class_name = _LAZY_STORES[store_type]
+    package = f"{__package__}.vector_store" if __package__ else "vector_store"
+    module = importlib.import_module(f"{package}.{module_name}")
+    return getattr(module, class_name)
+
+
 class SearchAgent:
     """Main search agent that coordinates vector store operations."""
     
@@ -32,18 +47,31 @@ class SearchAgent:
     ):
         self.store_type = store_type
         self.store_config = store_config or {}
+        # Initialized stores (and their clients/models) by type, reused across switches
+        self._stores: Dict[VectorStoreType, tuple] = {}
+        # Per-backend configs used when switching without an explicit config
+        self._store_configs: Dict[VectorStoreType, Dict[str, Any]] = {}
         self.vector_store = self._initialize_store()
     
     def _initialize_store(self) -> VectorStore:
-        """Initialize the appropriate vector store based on configuration."""
-        if self.store_type == VectorStoreType.PINECONE:
-            return PineconeStore(**self.store_config)
-        elif self.store_type == VectorStoreType.PINECONE_MCP:
-            return PineconeMCPStore(**self.store_config)
-        elif self.store_type == VectorStoreType.QDRANT:
-            return QdrantStore(**self.store_config)
+        """Initialize the appropriate vector store based on configuration.
+        
+        A store previously built for the same type and config is reused, so
+        switching back keeps its client connections and embedding model.
+        """
+        cached = self._stores.get(self.store_type)
+        if cached is not None and cached[0] == self.store_config:
+            return cached[1]
+        
+        if self.store_type == VectorStoreType.PINECONE_MCP:
+            store = PineconeMCPStore(**self.store_config)
+        elif self.store_type in _LAZY_STORES:
+            store = _load_store_class(self.store_type)(**self.store_config)
         else:
             raise ValueError(f"Unsupported vector store type: {self.store_type}")
+        
+        self._stores[self.store_type] = (dict(self.store_config), store)
+        return store
     
     async def create_index(
         self,
@@ -100,6 +128,28 @@ class SearchAgent:
         )
         return await self.vector_store.search(index_name, request)
     
+    async def semantic_search_batch(
+        self,
+        index_name: str,
+        queries: List[Dict[str, Any]]
+    ) -> List[List[SearchResult]]:
+        """Perform several semantic searches against one index in a single store call.
+        
+        Each query dict takes the same keys as semantic_search (query, top_k,
+        filter, namespace); results come back in query order.
+        """
+        requests = [
+            SearchRequest(
+                query=q["query"],
+                search_type=SearchType.SEMANTIC,
+                top_k=q.get("top_k", 10),
+                filter=q.get("filter"),
+                namespace=q.get("namespace")
+            )
+            for q in queries
+        ]
+        return await self.vector_store.search_batch(index_name, requests)
+    
     async def hybrid_search(
         self,
         index_name: str,
@@ -165,8 +215,8 @@ class SearchAgent:
             )
             return await self.vector_store.cascading_search(indexes, request)
         else:
-            # For other stores, perform search across each index and combine results
-            all_results = []
+            # For other stores, search all indexes concurrently and combine results
+            searches = []
             for index_config in indexes:
                 request = SearchRequest(
                     query=query,
@@ -175,12 +225,15 @@ class SearchAgent:
                     filter=filter,
                     namespace=index_config.get("namespace")
                 )
-                results = await self.vector_store.search(index_config["name"], request)
-                all_results.extend(results)
+                searches.append(self.vector_store.search(index_config["name"], request))
+            per_index_results = await asyncio.gather(*searches)
             
-            # Sort by score and return top_k
-            all_results.sort(key=lambda x: x.score, reverse=True)
-            return all_results[:top_k]
+            # Merge by score and return top_k
+            return heapq.nlargest(
+                top_k,
+                itertools.chain.from_iterable(per_index_results),
+                key=lambda x: x.score
+            )
     
     async def delete_documents(
         self,
@@ -198,16 +251,24 @@ class SearchAgent:
     async def batch_ingest(
         self,
         index_name: str,
-        documents: List[Dict[str, Any]],
+        documents: Iterable[Dict[str, Any]],
         batch_size: int = 100,
         namespace: Optional[str] = None
     ) -> bool:
-        """Ingest documents in batches for better performance."""
-        total_docs = len(documents)
+        """Ingest documents in batches for better performance.
+        
+        Documents may be any iterable (e.g. a generator); they are pulled
+        batch_size at a time, so only one batch is materialized at once.
+        """
+        total_docs = 0
         success_count = 0
         
-        for i in range(0, total_docs, batch_size):
-            batch = documents[i:i + batch_size]
+        doc_iter = iter(documents)
+        while True:
+            batch = list(itertools.islice(doc_iter, batch_size))
+            if not batch:
+                break
+            total_docs += len(batch)
             success = await self.ingest_documents(index_name, batch, namespace)
             if success:
                 success_count += len(batch)
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Union
+import asyncio
+from collections import OrderedDict
+from typing import Callable, List, Dict, Any, Optional, Union
 from pydantic import BaseModel, Field
 from enum import Enum
 
@@ -36,6 +38,51 @@ class SearchRequest(BaseModel):
     rerank_top_n: Optional[int] = None
 
 
+class QueryEmbeddingCache:
+    """LRU cache of query embeddings, filled by single or batched encodes."""
+    
+    def __init__(
+        self,
+        encode_text: Callable[[str], List[float]],
+        encode_texts: Callable[[List[str]], List[List[float]]],
+        maxsize: int = 256
+    ):
+        self._encode_text = encode_text
+        self._encode_texts = encode_texts
+        self.maxsize = maxsize
+        self._vectors: "OrderedDict[str, List[float]]" = OrderedDict()
+    
+    def encode(self, text: str) -> List[float]:
+        """Return the embedding for one query, encoding it only on a miss."""
+        vector = self._lookup(text)
+        if vector is None:
+            vector = self._encode_text(text)
+            self._store(text, vector)
+        return vector
+    
+    def encode_many(self, texts: List[str]) -> List[List[float]]:
+        """Return embeddings for several queries, batch-encoding only the misses."""
+        vectors = {text: self._lookup(text) for text in texts}
+        missing = [text for text, vector in vectors.items() if vector is None]
+        if missing:
+            for text, vector in zip(missing, self._encode_texts(missing)):
+                vectors[text] = vector
+                self._store(text, vector)
+        return [vectors[text] for text in texts]
+    
+    def _lookup(self, text: str) -> Optional[List[float]]:
+        vector = self._vectors.get(text)
+        if vector is not None:
+            self._vectors.move_to_end(text)
+        return vector
+    
+    def _store(self, text: str, vector: List[float]):
+        self._vectors[text] = vector
+        self._vectors.move_to_end(text)
+        if len(self._vectors) > self.maxsize:
+            self._vectors.popitem(last=False)
+
+
 class VectorStore(ABC):
     """Abstract base class for vector stores."""
     
@@ -73,6 +120,17 @@ class VectorStore(ABC):
         """Search for similar documents."""
         pass
     
+    async def search_batch(
+        self, 
+        index_name: str, 
+        requests: List[SearchRequest]
+    ) -> List[List[SearchResult]]:
+        """Run several searches against one index, returning results in request order.
+        
+        Stores with a native multi-query or batched embedding path should override this.
+        """
+        return list(await asyncio.gather(*(self.search(index_name, request) for request in requests)))
+    
     @abstractmethod
     async def delete_documents(
         self, 
@@ -131,7 +131,7 @@ class PineconeMCPStore(VectorStore):
             
             # Simulate search results
             search_results = [
-                SearchResult(
+                SearchResult.model_construct(
                     id=f"doc_{i}",
                     score=0.9 - (i * 0.1),
                     text=f"Sample document {i} matching '{request.query}'",
@@ -211,7 +211,7 @@ class PineconeMCPStore(VectorStore):
             
             # Simulate cascading search results
             search_results = [
-                SearchResult(
+                SearchResult.model_construct(
                     id=f"cascade_doc_{i}",
                     score=0.95 - (i * 0.05),
                     text=f"Cascaded document {i} from multiple indexes matching '{request.query}'",
@@ -6,9 +6,9 @@ from sentence_transformers import SentenceTransformer
 import numpy as np
 
 try:
-    from .base import VectorStore, Document, SearchResult, SearchRequest, SearchType
+    from .base import QueryEmbeddingCache, VectorStore, Document, SearchResult, SearchRequest, SearchType
 except ImportError:
-    from base import VectorStore, Document, SearchResult, SearchRequest, SearchType
+    from base import QueryEmbeddingCache, VectorStore, Document, SearchResult, SearchRequest, SearchType
 
 
 class PineconeStore(VectorStore):
@@ -29,6 +29,19 @@ class PineconeStore(VectorStore):
         self.pc = Pinecone(api_key=self.api_key)
         self.embedding_model = SentenceTransformer(embedding_model)
         self._embedding_dimension = self.embedding_model.get_sentence_embedding_dimension()
+        # Repeated queries reuse their embedding instead of re-running the model;
+        # single and batched searches share the cache
+        self._query_embeddings = QueryEmbeddingCache(self._encode_text, self._encode_texts)
+        self._encode_query = self._query_embeddings.encode
+        # pc.Index() builds a fresh HTTP client each call; keep one per index
+        self._indexes: Dict[str, Any] = {}
+    
+    def _index(self, name: str):
+        """Return a cached data-plane handle for an index, reusing its connection pool."""
+        index = self._indexes.get(name)
+        if index is None:
+            index = self._indexes[name] = self.pc.Index(name)
+        return index
     
     def _encode_text(self, text: str) -> List[float]:
         """Encode text to embedding vector."""
@@ -76,6 +89,7 @@ class PineconeStore(VectorStore):
         """Delete a Pinecone index."""
         try:
             self.pc.delete_index(name)
+            self._indexes.pop(name, None)
             return True
         except Exception as e:
             print(f"Error deleting index: {e}")
@@ -98,16 +112,17 @@ class PineconeStore(VectorStore):
     ) -> bool:
         """Insert or update documents in Pinecone."""
         try:
-            index = self.pc.Index(index_name)
+            index = self._index(index_name)
+            
+            # Generate missing embeddings in one batched call; the model
+            # length-sorts internally so similar-sized texts share a batch
+            missing = [doc.text for doc in documents if doc.embedding is None]
+            generated = iter(self._encode_texts(missing)) if missing else iter(())
             
             # Prepare vectors for upsert
             vectors = []
             for doc in documents:
-                # Generate embedding if not provided
-                if doc.embedding is None:
-                    embedding = self._encode_text(doc.text)
-                else:
-                    embedding = doc.embedding
+                embedding = doc.embedding if doc.embedding is not None else next(generated)
                 
                 vector = {
                     "id": doc.id,
@@ -137,48 +152,77 @@ class PineconeStore(VectorStore):
     ) -> List[SearchResult]:
         """Search for similar documents in Pinecone."""
         try:
-            index = self.pc.Index(index_name)
+            index = self._index(index_name)
             
             # Generate query embedding
-            query_embedding = self._encode_text(request.query)
-            
-            # Prepare search parameters
-            search_params = {
-                "vector": query_embedding,
-                "top_k": request.top_k,
-                "include_metadata": True,
-                "namespace": request.namespace
-            }
-            
-            # Add filter if provided
-            if request.filter:
-                search_params["filter"] = request.filter
-            
-            # Execute search
-            if request.search_type == SearchType.HYBRID and request.alpha is not None:
-                # For hybrid search, we would need to implement sparse vector support
-                # This is a simplified version - in practice, you'd need sparse embeddings
-                results = index.query(**search_params)
-            else:
-                # Pure semantic search
-                results = index.query(**search_params)
-            
-            # Convert results to SearchResult objects
-            search_results = []
-            for match in results.matches:
-                result = SearchResult(
-                    id=match.id,
-                    score=match.score,
-                    text=match.metadata.get("text", ""),
-                    metadata={k: v for k, v in match.metadata.items() if k != "text"}
-                )
-                search_results.append(result)
-            
-            return search_results
+            query_embedding = self._encode_query(request.query)
+            return await self._query(index, request, query_embedding)
         except Exception as e:
             print(f"Error searching: {e}")
             return []
     
+    async def search_batch(
+        self, 
+        index_name: str, 
+        requests: List[SearchRequest]
+    ) -> List[List[SearchResult]]:
+        """Search Pinecone for several queries, embedding them in one model call."""
+        try:
+            index = self._index(index_name)
+            texts = list(dict.fromkeys(request.query for request in requests))
+            vectors = dict(zip(texts, self._query_embeddings.encode_many(texts)))
+        except Exception as e:
+            print(f"Error searching: {e}")
+            return [[] for _ in requests]
+        
+        # Pinecone queries take one vector each, so the queries run concurrently instead
+        batch_results = await asyncio.gather(
+            *(self._query(index, request, vectors[request.query]) for request in requests),
+            return_exceptions=True
+        )
+        for i, result in enumerate(batch_results):
+            if isinstance(result, Exception):
+                print(f"Error searching: {result}")
+                batch_results[i] = []
+        return batch_results
+    
+    async def _query(self, index, request: SearchRequest, query_embedding: List[float]) -> List[SearchResult]:
+        """Run one Pinecone query for an already-encoded request."""
+        # Prepare search parameters
+        search_params = {
+            "vector": query_embedding,
+            "top_k": request.top_k,
+            "include_metadata": True,
+            "namespace": request.namespace
+        }
+        
+        # Add filter if provided
+        if request.filter:
+            search_params["filter"] = request.filter
+        
+        # Execute search in a worker thread so concurrent searches (e.g. cascading
+        # across indexes) overlap their network round-trips
+        if request.search_type == SearchType.HYBRID and request.alpha is not None:
+            # For hybrid search, we would need to implement sparse vector support
+            # This is a simplified version - in practice, you'd need sparse embeddings
+            results = await asyncio.to_thread(index.query, **search_params)
+        else:
+            # Pure semantic search
+            results = await asyncio.to_thread(index.query, **search_params)
+        
+        # Convert results to SearchResult objects
+        search_results = []
+        for match in results.matches:
+            result = SearchResult.model_construct(
+                id=match.id,
+                score=match.score,
+                text=match.metadata.get("text", ""),
+                metadata={k: v for k, v in match.metadata.items() if k != "text"}
+            )
+            search_results.append(result)
+        
+        return search_results
+    
     async def delete_documents(
         self, 
         index_name: str, 
@@ -187,7 +231,7 @@ class PineconeStore(VectorStore):
     ) -> bool:
         """Delete documents by IDs from Pinecone."""
         try:
-            index = self.pc.Index(index_name)
+            index = self._index(index_name)
             index.delete(ids=ids, namespace=namespace)
             return True
         except Exception as e:
@@ -197,7 +241,7 @@ class PineconeStore(VectorStore):
     async def get_index_stats(self, index_name: str) -> Dict[str, Any]:
         """Get statistics about a Pinecone index."""
         try:
-            index = self.pc.Index(index_name)
+            index = self._index(index_name)
             stats = index.describe_index_stats()
             # Handle both dict and object-like responses
             if isinstance(stats, dict):
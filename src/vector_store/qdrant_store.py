@@ -2,12 +2,13 @@ from typing import List, Dict, Any, Optional
 import asyncio
 from qdrant_client import QdrantClient
 from qdrant_client.models import Distance, VectorParams, PointStruct, Filter, FieldCondition, MatchValue
+from qdrant_client.models import SearchRequest as QdrantSearchRequest
 from sentence_transformers import SentenceTransformer
 
 try:
-    from .base import VectorStore, Document, SearchResult, SearchRequest, SearchType
+    from .base import QueryEmbeddingCache, VectorStore, Document, SearchResult, SearchRequest, SearchType
 except ImportError:
-    from base import VectorStore, Document, SearchResult, SearchRequest, SearchType
+    from base import QueryEmbeddingCache, VectorStore, Document, SearchResult, SearchRequest, SearchType
 
 
 class QdrantStore(VectorStore):
@@ -23,6 +24,10 @@ class QdrantStore(VectorStore):
         self.client = QdrantClient(host=host, port=port, api_key=api_key)
         self.embedding_model = SentenceTransformer(embedding_model)
         self._embedding_dimension = self.embedding_model.get_sentence_embedding_dimension()
+        # Cache query vectors so identical searches skip the encoder; single and
+        # batched searches share the cache
+        self._query_embeddings = QueryEmbeddingCache(self._encode_text, self._encode_texts)
+        self._encode_query = self._query_embeddings.encode
     
     def _encode_text(self, text: str) -> List[float]:
         """Encode text to embedding vector."""
@@ -85,13 +90,13 @@ class QdrantStore(VectorStore):
     ) -> bool:
         """Insert or update documents in Qdrant."""
         try:
+            # Embed all documents lacking a vector in a single batch
+            missing = [doc.text for doc in documents if doc.embedding is None]
+            generated = iter(self._encode_texts(missing)) if missing else iter(())
+            
             points = []
             for doc in documents:
-                # Generate embedding if not provided
-                if doc.embedding is None:
-                    embedding = self._encode_text(doc.text)
-                else:
-                    embedding = doc.embedding
+                embedding = doc.embedding if doc.embedding is not None else next(generated)
                 
                 # Prepare payload
                 payload = {
@@ -128,59 +133,91 @@ class QdrantStore(VectorStore):
         """Search for similar documents in Qdrant."""
         try:
             # Generate query embedding
-            query_embedding = self._encode_text(request.query)
-            
-            # Prepare search filter
-            search_filter = None
-            if request.filter or request.namespace:
-                conditions = []
-                
-                # Add namespace filter
-                if request.namespace:
-                    conditions.append(
-                        FieldCondition(
-                            key="namespace",
-                            match=MatchValue(value=request.namespace)
-                        )
-                    )
-                
-                # Add custom filters
-                if request.filter:
-                    for key, value in request.filter.items():
-                        conditions.append(
-                            FieldCondition(
-                                key=key,
-                                match=MatchValue(value=value)
-                            )
-                        )
-                
-                if conditions:
-                    search_filter = Filter(must=conditions)
+            query_embedding = self._encode_query(request.query)
             
-            # Execute search
-            results = self.client.search(
+            # Execute search in a worker thread so concurrent searches (e.g. cascading
+            # across collections) overlap their network round-trips
+            results = await asyncio.to_thread(
+                self.client.search,
                 collection_name=index_name,
                 query_vector=query_embedding,
                 limit=request.top_k,
-                query_filter=search_filter
+                query_filter=self._build_filter(request)
             )
             
-            # Convert results to SearchResult objects
-            search_results = []
-            for result in results:
-                search_result = SearchResult(
-                    id=str(result.id),
-                    score=result.score,
-                    text=result.payload.get("text", ""),
-                    metadata={k: v for k, v in result.payload.items() if k not in ["text", "namespace"]}
-                )
-                search_results.append(search_result)
-            
-            return search_results
+            return self._to_search_results(results)
         except Exception as e:
             print(f"Error searching: {e}")
             return []
     
+    async def search_batch(
+        self, 
+        index_name: str, 
+        requests: List[SearchRequest]
+    ) -> List[List[SearchResult]]:
+        """Search Qdrant for several queries with one embedding call and one search_batch RPC."""
+        try:
+            texts = list(dict.fromkeys(request.query for request in requests))
+            vectors = dict(zip(texts, self._query_embeddings.encode_many(texts)))
+            
+            batch_results = await asyncio.to_thread(
+                self.client.search_batch,
+                collection_name=index_name,
+                requests=[
+                    QdrantSearchRequest(
+                        vector=vectors[request.query],
+                        limit=request.top_k,
+                        filter=self._build_filter(request),
+                        with_payload=True
+                    )
+                    for request in requests
+                ]
+            )
+            
+            return [self._to_search_results(results) for results in batch_results]
+        except Exception as e:
+            print(f"Error searching: {e}")
+            return [[] for _ in requests]
+    
+    def _build_filter(self, request: SearchRequest) -> Optional[Filter]:
+        """Translate the request namespace and metadata filter into a Qdrant filter."""
+        conditions = []
+        
+        # Add namespace filter
+        if request.namespace:
+            conditions.append(
+                FieldCondition(
+                    key="namespace",
+                    match=MatchValue(value=request.namespace)
+                )
+            )
+        
+        # Add custom filters
+        if request.filter:
+            for key, value in request.filter.items():
+                conditions.append(
+                    FieldCondition(
+                        key=key,
+                        match=MatchValue(value=value)
+                    )
+                )
+        
+        return Filter(must=conditions) if conditions else None
+    
+    def _to_search_results(self, results) -> List[SearchResult]:
+        """Convert Qdrant scored points to SearchResult objects."""
+        search_results = []
+        for result in results:
+            search_result = SearchResult.model_construct(
+                id=str(result.id),
+                score=result.score,
+                text=result.payload.get("text", ""),
+                metadata={k: v for k, v in result.payload.items() if k not in ["text", "namespace"]}
+            )
+            search_results.append(search_result)
+        
+        return search_results
+    
     async def delete_documents(
         self, 
         index_name: str, 
@@ -27,29 +27,37 @@ async def test_indexes():
             ("iam-policy-guide-context", "aws-iam-examples")
         ]
         
-        for index_name, namespace in test_indexes:
+        async def search_index(index_name, namespace):
+            # Create a proper SearchRequest
+            request = SearchRequest(
+                query="IAM policy S3 access",
+                top_k=3,
+                namespace=namespace,
+                search_type=SearchType.SEMANTIC
+            )
+            
+            # Try a simple search
+            return await store.search(
+                index_name=index_name,
+                request=request
+            )
+        
+        # The indexes are independent, so search them concurrently and report in order
+        outcomes = await asyncio.gather(
+            *(search_index(index_name, namespace) for index_name, namespace in test_indexes),
+            return_exceptions=True
+        )
+        
+        for (index_name, namespace), results in zip(test_indexes, outcomes):
             print(f"\n🔍 Testing index: {index_name}, namespace: {namespace}")
-            try:
-                # Create a proper SearchRequest
-                request = SearchRequest(
-                    query="IAM policy S3 access",
-                    top_k=3,
-                    namespace=namespace,
-                    search_type=SearchType.SEMANTIC
-                )
-                
-                # Try a simple search
-                results = await store.search(
-                    index_name=index_name,
-                    request=request
-                )
-                print(f"✅ Found {len(results)} results in {index_name}")
-                if results:
-                    print(f"   Sample result: {results[0].text[:100]}...")
-                else:
-                    print("   No results found")
-            except Exception as e:
-                print(f"❌ Error searching {index_name}: {e}")
+            if isinstance(results, Exception):
+                print(f"❌ Error searching {index_name}: {results}")
+                continue
+            print(f"✅ Found {len(results)} results in {index_name}")
+            if results:
+                print(f"   Sample result: {results[0].text[:100]}...")
+            else:
+                print("   No results found")
         
     except Exception as e:
         print(f"❌ Error initializing: {e}")
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Tests for the PDF ingestion chunkers in examples/pdf_ingestion.py
+"""
+
+import os
+import sys
+import pytest
+import tiktoken
+
+# Add the examples directory to the path
+project_root = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(project_root, "examples"))
+
+from pdf_ingestion import PDFProcessor
+
+
+# Paragraphs of 6-22 words, each short enough to fit in one chunk on its own,
+# so every chunk after the first is seeded with overlap
+SAMPLE_TEXT = "\n\n".join(
+    " ".join(f"w{p}_{i}" for i in range(6 + (p * 7) % 17))
+    for p in range(30)
+)
+
+
+def _byte_encoding() -> tiktoken.Encoding:
+    """A byte-level tokenizer built offline: every multi-byte character spans several tokens."""
+    return tiktoken.Encoding(
+        name="test_bytes",
+        pat_str=r"""'s|'t|'re|'ve|'m|'ll|'d| ?\p{L}+| ?\p{N}+| ?[^\s\p{L}\p{N}]+|\s+(?!\S)|\s+""",
+        mergeable_ranks={bytes([i]): i for i in range(256)},
+        special_tokens={}
+    )
+
+
+def _processor(encoding=None) -> PDFProcessor:
+    """A processor without the HTTP session or the downloaded tokenizer."""
+    processor = PDFProcessor.__new__(PDFProcessor)
+    processor.encoding = encoding
+    return processor
+
+
+def _chunk(text, chunk_size, overlap):
+    return [
+        (chunk["text"], chunk["token_count"])
+        for chunk in _processor().chunk_text(text, chunk_size, overlap, legacy=True)
+    ]
+
+
+@pytest.mark.parametrize("overlap, expected", [
+    (0, [
+        ("Alpha beta gamma.", 4),
+        ("Delta epsilon zeta eta.", 5),
+        ("Theta iota kappa.", 4),
+    ]),
+    # ceil(3 / 4) = 1 word of overlap
+    (3, [
+        ("Alpha beta gamma.", 4),
+        ("gamma.\n\nDelta epsilon zeta eta.", 6),
+        ("eta.\n\nTheta iota kappa.", 5),
+    ]),
+    # ceil(5 / 4) = 2 words of overlap
+    (5, [
+        ("Alpha beta gamma.", 4),
+        ("beta gamma.\n\nDelta epsilon zeta eta.", 7),
+        ("zeta eta.\n\nTheta iota kappa.", 6),
+    ]),
+])
+def test_string_chunker_paragraph_overlap(overlap, expected):
+    text = "Alpha beta gamma.\n\nDelta epsilon zeta eta.\n\nTheta iota kappa."
+    assert _chunk(text, 8, overlap) == expected
+
+
+@pytest.mark.parametrize("overlap, expected", [
+    (0, [
+        ("One two three. Four five six.", 6),
+        ("Seven eight nine ten.", 5),
+        ("Eleven twelve.", 3),
+        ("Tail words here.", 4),
+    ]),
+    # ceil(2 / 4) = 1 word of overlap, for sentence and paragraph boundaries alike
+    (2, [
+        ("One two three. Four five six.", 6),
+        ("six. Seven eight nine ten.", 6),
+        ("ten. Eleven twelve.", 4),
+        ("twelve.\n\nTail words here.", 5),
+    ]),
+])
+def test_string_chunker_sentence_overlap(overlap, expected):
+    text = "One two three. Four five six. Seven eight nine ten. Eleven twelve.\n\nTail words here."
+    assert _chunk(text, 6, overlap) == expected
+
+
+@pytest.mark.parametrize("overlap", [0, 1, 2, 3, 5, 6, 7, 9, 30, 33])
+@pytest.mark.parametrize("chunk_size", [60, 100, 250])
+def test_string_chunker_overlap_properties(chunk_size, overlap):
+    processor = _processor()
+    chunks = processor.chunk_text(SAMPLE_TEXT, chunk_size, overlap, legacy=True)
+    overlap_words = -(-overlap // 4)
+    
+    assert [chunk["chunk_id"] for chunk in chunks] == list(range(len(chunks)))
+    
+    remaining = []
+    previous_words = None
+    for chunk in chunks:
+        words = chunk["text"].split()
+        if previous_words is None:
+            carried = []
+        else:
+            # Each chunk starts with the last ceil(overlap / 4) words of the one before
+            carried = previous_words[-overlap_words:] if overlap_words else []
+            assert words[:len(carried)] == carried
+        
+        assert 0 < chunk["token_count"] <= chunk_size + processor.count_tokens(" ".join(carried))
+        remaining.extend(words[len(carried):])
+        previous_words = words
+    
+    # Without the carried-over words, the chunks spell out the input exactly
+    assert remaining == SAMPLE_TEXT.split()
+
+
+@pytest.mark.parametrize("chunk_size, overlap", [(1, 0), (3, 2), (10, 3), (50, 7), (256, 32)])
+def test_token_chunker_keeps_multibyte_characters_whole(chunk_size, overlap):
+    processor = _processor(_byte_encoding())
+    text = "Ärger über Straßen — naïve café 😀 日本語のテキスト.\n\n" * 20
+    chunks = processor.chunk_text(text, chunk_size, overlap)
+    assert chunks
+    for chunk in chunks:
+        assert "\ufffd" not in chunk["text"]
+        assert chunk["text"] in text